@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Any, Optional
@@ -20,6 +21,11 @@ ROBINHOOD_CLIENT_ID = "c82SH0WZOsabOXGP2sxqcj34FxkvfnWRZBKlBjFS"
 DEFAULT_TOKEN_EXPIRES_IN = 86400
 DEFAULT_REFRESH_MARGIN_SECONDS = 3600
 
+# In-process copy of the active session, keyed by cache path, so repeated
+# get_session() calls from tool handlers skip re-reading session.json.
+_ACTIVE_SESSION: dict[str, Any] = {}
+_ACTIVE_SESSION_LOCK = threading.Lock()
+
 
 class AuthenticationError(click.ClickException):
     """Raised when a usable Robinhood session cannot be created."""
@@ -50,7 +56,28 @@ def get_credentials(mfa_code: Optional[str] = None) -> tuple[str, str, Optional[
     return username, password, mfa
 
 
+def _forget_active_session() -> None:
+    with _ACTIVE_SESSION_LOCK:
+        _ACTIVE_SESSION.clear()
+
+
+def _remember_active_session(data: dict) -> dict:
+    with _ACTIVE_SESSION_LOCK:
+        _ACTIVE_SESSION.clear()
+        _ACTIVE_SESSION[str(SESSION_CACHE)] = data
+    return data
+
+
+def _active_session() -> dict | None:
+    with _ACTIVE_SESSION_LOCK:
+        data = _ACTIVE_SESSION.get(str(SESSION_CACHE))
+    if data is None or _session_expires_soon(data):
+        return None
+    return data
+
+
 def _remove_invalid_cache() -> None:
+    _forget_active_session()
     try:
         SESSION_CACHE.unlink()
     except FileNotFoundError:
@@ -171,6 +198,12 @@ def _activate_session(data: dict) -> dict[str, str]:
 
 def get_session(mfa_code: Optional[str] = None) -> dict[str, str]:
     """Return a cached session or log in to Robinhood."""
+    if mfa_code is None:
+        data = _active_session()
+        if data is not None:
+            if not helper.LOGGED_IN:
+                _activate_session(data)
+            return data
     if SESSION_CACHE.exists():
         try:
             data = json.loads(SESSION_CACHE.read_text())
@@ -185,7 +218,7 @@ def get_session(mfa_code: Optional[str] = None) -> dict[str, str]:
                         # Persist metadata for older cache files without changing the token.
                         if "expires_at" not in data or "created_at" not in data:
                             _cache_session(data)
-                    return _activate_session(data)
+                    return _remember_active_session(_activate_session(data))
                 except AuthenticationError:
                     if os.getenv("MCP_SERVER_MODE"):
                         raise
@@ -200,11 +233,12 @@ def get_session(mfa_code: Optional[str] = None) -> dict[str, str]:
             f"{_extract_login_error(session)}"
         )
     cached = _cache_session({**session, "created_at": _now()})
-    return _activate_session(cached)
+    return _remember_active_session(_activate_session(cached))
 
 
 def logout() -> None:
     """Clear the cached session."""
+    _forget_active_session()
     if SESSION_CACHE.exists():
         SESSION_CACHE.unlink()
     rh.logout()
@@ -5,6 +5,9 @@ from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
 LAST_MACRO_NEWS_META: Dict[str, Any] = {}
+_SESSION = requests.Session()
+_STREAM_CHUNK_BYTES = 8192
+_UNDATED_SORT_KEY = datetime.min.replace(tzinfo=timezone.utc)
 
 
 def get_macro_news_meta() -> Dict[str, Any]:
@@ -41,19 +44,22 @@ def get_macro_news(limit: int = 5, only_today: bool = False) -> List[Dict[str, s
     
     for source_name, url in sources.items():
         try:
-            response = requests.get(url, headers=headers, timeout=5)
-            if response.status_code != 200:
-                sources_failed.append({"source": source_name, "error": f"http_{response.status_code}"})
-                continue
-                
-            # Parse XML
-            root = ET.fromstring(response.content)
+            # Stream the body into an incremental parser so parsing overlaps
+            # the download and the raw bytes are never buffered in full.
+            with _SESSION.get(url, headers=headers, timeout=5, stream=True) as response:
+                if response.status_code != 200:
+                    sources_failed.append({"source": source_name, "error": f"http_{response.status_code}"})
+                    continue
+
+                parser = ET.XMLParser()
+                for chunk in response.iter_content(_STREAM_CHUNK_BYTES):
+                    parser.feed(chunk)
+                root = parser.close()
             items = root.findall("./channel/item")
             sources_ok.append(source_name)
             
             for item in items:
-                pub_date_str = item.find("pubDate").text if item.find("pubDate") is not None else ""
-                
+                pub_date_str = item.findtext("pubDate", default="")
                 dt_obj = None
                 if pub_date_str:
                     try:
@@ -78,21 +84,18 @@ def get_macro_news(limit: int = 5, only_today: bool = False) -> List[Dict[str, s
                      if dt_local.date() != today_local:
                          continue
 
-                title = item.find("title").text if item.find("title") is not None else "No Title"
-                link = item.find("link").text if item.find("link") is not None else ""
-                description = item.find("description").text if item.find("description") is not None else ""
+                title = item.findtext("title", default="No Title")
+                link = item.findtext("link", default="")
+                description = item.findtext("description", default="")
                 
-                parsed_at_unknown = dt_obj is None
-                sort_date = dt_obj if dt_obj else datetime.min.replace(tzinfo=timezone.utc)
-
                 all_news.append({
                     "title": title,
                     "link": link,
                     "published": pub_date_str,
                     "summary": description,
                     "source": source_name,
-                    "parsed_at_unknown": parsed_at_unknown,
-                    "_sort_date": sort_date
+                    "parsed_at_unknown": dt_obj is None,
+                    "_sort_date": dt_obj or _UNDATED_SORT_KEY
                 })
                 
         except Exception as e:
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
+import numpy as np
 import pandas as pd
 import pandas_market_calendars as mcal
 import pytz
@@ -19,11 +21,27 @@ REGULAR_CLOSE_ET = (16, 0)     # 4:00 PM ET
 AFTERHOURS_CLOSE_ET = (20, 0)  # 8:00 PM ET
 
 
+@lru_cache(maxsize=1)
 def _get_calendar():
     """Get the NYSE calendar (covers NASDAQ holidays too)."""
     return mcal.get_calendar("NYSE")
 
 
+@lru_cache(maxsize=1)
+def _sorted_holidays_arr() -> np.ndarray:
+    """Sorted ``datetime64[D]`` array of NYSE full-day closures (regular + ad hoc)."""
+    holidays = _get_calendar().holidays()
+    if holidays is None:
+        return np.array([], dtype="datetime64[D]")
+    return np.sort(np.asarray(holidays.holidays, dtype="datetime64[D]"))
+
+
+def _next_trading_day(after: date) -> date:
+    """First weekday strictly after ``after`` that is not an exchange holiday."""
+    start = np.datetime64(after, "D") + 1
+    return np.busday_offset(start, 0, roll="forward", holidays=_sorted_holidays_arr()).astype(date)
+
+
 def get_market_status(dt: Optional[datetime] = None) -> Dict[str, Any]:
     """
     Determine the current market session and schedule for today.
@@ -76,46 +94,48 @@ def get_market_status(dt: Optional[datetime] = None) -> Dict[str, Any]:
         result["is_trading_day"] = True
         row = schedule_range.loc[today_ts]
 
-        pre_open = row["pre"].to_pydatetime()
-        market_open = row["market_open"].to_pydatetime()
-        market_close = row["market_close"].to_pydatetime()
-        post_close = row["post"].to_pydatetime()
+        # Stay in pandas Timestamp space: one tz_convert per field instead of
+        # to_pydatetime() copies plus repeated astimezone() calls.
+        pre_open = row["pre"].tz_convert(ET)
+        market_open = row["market_open"].tz_convert(ET)
+        market_close = row["market_close"].tz_convert(ET)
+        post_close = row["post"].tz_convert(ET)
 
         # Check for early close (regular close before 4:00 PM ET)
-        mc_et = market_close.astimezone(ET)
-        if mc_et.hour < 16:
+        if market_close.hour < 16:
             result["is_early_close"] = True
 
         result["schedule"] = {
-            "premarket_open": pre_open.astimezone(ET).strftime("%H:%M %Z"),
-            "regular_open": market_open.astimezone(ET).strftime("%H:%M %Z"),
-            "regular_close": mc_et.strftime("%H:%M %Z"),
-            "afterhours_close": post_close.astimezone(ET).strftime("%H:%M %Z"),
+            "premarket_open": pre_open.strftime("%H:%M %Z"),
+            "regular_open": market_open.strftime("%H:%M %Z"),
+            "regular_close": market_close.strftime("%H:%M %Z"),
+            "afterhours_close": post_close.strftime("%H:%M %Z"),
         }
 
         # Determine current session
-        dt_utc = dt.astimezone(pytz.utc)
-        if dt_utc < pre_open:
+        dt_ts = pd.Timestamp(dt)
+        if dt_ts < pre_open:
             result["session"] = "closed"
-            result["next_open"] = pre_open.astimezone(ET).strftime("%H:%M %Z")
-        elif dt_utc < market_open:
+            result["next_open"] = result["schedule"]["premarket_open"]
+        elif dt_ts < market_open:
             result["session"] = "pre-market"
-            result["next_open"] = market_open.astimezone(ET).strftime("%H:%M %Z")
-        elif dt_utc < market_close:
+            result["next_open"] = result["schedule"]["regular_open"]
+        elif dt_ts < market_close:
             result["session"] = "regular"
-            result["next_close"] = mc_et.strftime("%H:%M %Z")
-        elif dt_utc < post_close:
+            result["next_close"] = result["schedule"]["regular_close"]
+        elif dt_ts < post_close:
             result["session"] = "after-hours"
-            result["next_close"] = post_close.astimezone(ET).strftime("%H:%M %Z")
+            result["next_close"] = result["schedule"]["afterhours_close"]
         else:
             result["session"] = "closed"
     else:
         # Not a trading day -- figure out why
         # Check holidays
-        holidays = cal.holidays()
-        if holidays is not None:
-            hol_index = holidays.holidays
-            if today in hol_index:
+        hol_index = _sorted_holidays_arr()
+        if hol_index.size:
+            today_d = np.datetime64(today, "D")
+            pos = int(np.searchsorted(hol_index, today_d))
+            if pos < hol_index.size and hol_index[pos] == today_d:
                 result["holiday"] = "Market Holiday"
             elif today.weekday() >= 5:
                 result["holiday"] = "Weekend"
@@ -126,22 +146,26 @@ def get_market_status(dt: Optional[datetime] = None) -> Dict[str, Any]:
     if result["session"] == "closed":
         future_days = schedule_range[schedule_range.index > today_ts]
         if future_days.empty:
-            # Extend the range
-            extended = cal.schedule(
-                start_date=(today + timedelta(days=1)).isoformat(),
-                end_date=(today + timedelta(days=30)).isoformat(),
-                start="pre",
-                end="post",
-            )
+            # Derive the next session date from the holiday array and schedule
+            # just that day; fall back to a 30-day scan if the rule data disagree.
+            next_day = _next_trading_day(today).isoformat()
+            extended = cal.schedule(start_date=next_day, end_date=next_day, start="pre", end="post")
+            if extended.empty:
+                extended = cal.schedule(
+                    start_date=(today + timedelta(days=1)).isoformat(),
+                    end_date=(today + timedelta(days=30)).isoformat(),
+                    start="pre",
+                    end="post",
+                )
             if not extended.empty:
                 next_row = extended.iloc[0]
                 next_date = extended.index[0].strftime("%Y-%m-%d")
-                next_pre = next_row["pre"].to_pydatetime().astimezone(ET)
+                next_pre = next_row["pre"].tz_convert(ET)
                 result["next_open"] = f"{next_date} {next_pre.strftime('%H:%M %Z')}"
         else:
             next_row = future_days.iloc[0]
             next_date = future_days.index[0].strftime("%Y-%m-%d")
-            next_pre = next_row["pre"].to_pydatetime().astimezone(ET)
+            next_pre = next_row["pre"].tz_convert(ET)
             result["next_open"] = f"{next_date} {next_pre.strftime('%H:%M %Z')}"
 
     return result
@@ -196,14 +220,13 @@ def get_early_closes(year: Optional[int] = None, limit: int = 10) -> List[Dict[s
     if year is None:
         year = date.today().year
 
-    early = cal.early_closes(schedule=cal.schedule(
-        start_date=f"{year}-01-01",
-        end_date=f"{year}-12-31",
-    ))
+    # Enumerate only the special-close rule dates for the year instead of
+    # building a full annual schedule and filtering it down.
+    early = cal.special_dates("market_close", f"{year}-01-01", f"{year}-12-31")
 
     result = []
-    for idx, row in early.iterrows():
-        close_et = row["market_close"].to_pydatetime().astimezone(ET)
+    for idx, close_ts in early.items():
+        close_et = close_ts.tz_convert(ET)
         result.append({
             "date": idx.strftime("%Y-%m-%d"),
             "day": idx.strftime("%A"),
@@ -1,6 +1,8 @@
 """Quant-related MCP tool registrations."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 from quant import (
     calculate_iv_rank,
     detect_unusual_options_activity,
@@ -11,6 +13,9 @@ from quant import (
     get_technical_indicators as calculate_technical_indicators,
     get_volume_velocity as calculate_volume_velocity,
 )
+from tool_cache import cached_tool_call
+
+_QUOTE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="multi-quote")
 
 
 def register_quant_tools(mcp) -> None:
@@ -25,8 +30,8 @@ def register_quant_tools(mcp) -> None:
         Note: relative_volume is daily volume vs prior 20 full-day average. For intraday
         participation, use get_volume_velocity_tool instead.
         """
-        result = calculate_technical_indicators(symbol)
         sym = str(symbol).upper()
+        result = cached_tool_call(("ti", sym), lambda: calculate_technical_indicators(symbol))
         if result.get("error"):
             return {
                 "symbol": sym,
@@ -70,14 +75,17 @@ def register_quant_tools(mcp) -> None:
         the prior N bars. Use it for intraday participation/acceleration checks
         instead of daily relative_volume.
         """
-        result = calculate_volume_velocity(
-            symbol=symbol,
-            interval=interval,
-            period=period,
-            baseline_bars=baseline_bars,
-            series_points=series_points,
-        )
         sym = str(symbol).upper().strip()
+        result = cached_tool_call(
+            ("volume_velocity", sym, interval, period, baseline_bars, series_points),
+            lambda: calculate_volume_velocity(
+                symbol=symbol,
+                interval=interval,
+                period=period,
+                baseline_bars=baseline_bars,
+                series_points=series_points,
+            ),
+        )
         if result.get("error"):
             return {
                 **result,
@@ -104,7 +112,7 @@ def register_quant_tools(mcp) -> None:
         Get 5-day performance of major sector ETFs to identify leaders/laggards.
         Returns a list of sectors sorted by performance.
         """
-        results = calculate_sector_performance()
+        results = cached_tool_call(("sector_performance",), calculate_sector_performance)
         if not results:
             return {"sectors": [], "count": 0, "result_text": "No sector data found."}
 
@@ -127,7 +135,7 @@ def register_quant_tools(mcp) -> None:
         Get peer ticker candidates plus sector/industry classification.
         """
         sym = str(symbol).upper()
-        result = get_symbol_peer_candidates(symbol)
+        result = cached_tool_call(("peers", sym), lambda: get_symbol_peer_candidates(symbol))
         if result.get("error"):
             return {
                 "symbol": sym,
@@ -152,7 +160,7 @@ def register_quant_tools(mcp) -> None:
     @mcp.tool()
     def get_portfolio_correlation_tool(symbols: str) -> dict:
         """
-        Calculate correlation matrix for a list of symbols (comma-separated).
+        Calculate the daily-return correlation matrix for a list of symbols (comma-separated).
         Useful for checking portfolio diversification and risk concentration.
         Returns correlation matrix and identifies high-correlation pairs (>0.7).
         """
@@ -163,7 +171,7 @@ def register_quant_tools(mcp) -> None:
                 "error": "symbols is required (comma-separated tickers, e.g. 'AAPL,MSFT,GOOG').",
                 "result_text": "Error: symbols is required (comma-separated tickers).",
             }
-        result = get_portfolio_correlation(sym_list)
+        result = cached_tool_call(("correlation", tuple(sym_list)), lambda: get_portfolio_correlation(sym_list))
 
         if result.get("error"):
             return {
@@ -205,7 +213,7 @@ def register_quant_tools(mcp) -> None:
             symbol: Stock ticker (e.g. AAPL)
         """
         sym = str(symbol).upper().strip()
-        result = calculate_iv_rank(sym)
+        result = cached_tool_call(("iv_rank", sym), lambda: calculate_iv_rank(sym))
         if result is None:
             return {
                 "symbol": sym,
@@ -252,7 +260,9 @@ def register_quant_tools(mcp) -> None:
         try:
             from yahoo_finance import get_yf_options
 
-            data = get_yf_options(sym, expiration_date)
+            data = cached_tool_call(
+                ("yf_options", sym, expiration_date), lambda: get_yf_options(sym, expiration_date)
+            )
             calls = data.get("calls", [])
             puts = data.get("puts", [])
             current_price = float(data.get("current_price", 0) or 0)
@@ -359,37 +369,45 @@ def register_quant_tools(mcp) -> None:
                 "result_text": "Error: symbols is required.",
             }
 
+        def fetch_one(sym: str) -> dict:
+            ticker = yf.Ticker(sym)
+            info = ticker.info or {}
+            quote = {
+                "symbol": sym,
+                "price": info.get("regularMarketPrice") or info.get("currentPrice"),
+                "regular_market_time": info.get("regularMarketTime"),
+                "previous_close": info.get("previousClose"),
+                "change_pct": None,
+                "volume": info.get("volume"),
+                "avg_volume": info.get("averageVolume"),
+                "market_cap": info.get("marketCap"),
+                "pe_ratio": info.get("trailingPE"),
+                "52w_high": info.get("fiftyTwoWeekHigh"),
+                "52w_low": info.get("fiftyTwoWeekLow"),
+                "beta": info.get("beta"),
+                "sector": info.get("sector"),
+                "data_quality": {
+                    "source": "yfinance_ticker_info",
+                    "quote_time": info.get("regularMarketTime"),
+                    "warning": "Yahoo quote timing and delay status are provider-dependent.",
+                },
+            }
+            price = quote["price"]
+            prev = quote["previous_close"]
+            if price and prev and prev > 0:
+                quote["change_pct"] = round((price - prev) / prev * 100, 2)
+            return quote
+
+        # Yahoo round trips are I/O bound: fetch concurrently, report in input order.
+        futures = [
+            (sym, _QUOTE_EXECUTOR.submit(fetch_one, sym))
+            for sym in sym_list[:10]  # Cap at 10 to avoid excessive API calls
+        ]
         quotes = []
         errors = []
-        for sym in sym_list[:10]:  # Cap at 10 to avoid excessive API calls
+        for sym, future in futures:
             try:
-                ticker = yf.Ticker(sym)
-                info = ticker.info or {}
-                quote = {
-                    "symbol": sym,
-                    "price": info.get("regularMarketPrice") or info.get("currentPrice"),
-                    "regular_market_time": info.get("regularMarketTime"),
-                    "previous_close": info.get("previousClose"),
-                    "change_pct": None,
-                    "volume": info.get("volume"),
-                    "avg_volume": info.get("averageVolume"),
-                    "market_cap": info.get("marketCap"),
-                    "pe_ratio": info.get("trailingPE"),
-                    "52w_high": info.get("fiftyTwoWeekHigh"),
-                    "52w_low": info.get("fiftyTwoWeekLow"),
-                    "beta": info.get("beta"),
-                    "sector": info.get("sector"),
-                    "data_quality": {
-                        "source": "yfinance_ticker_info",
-                        "quote_time": info.get("regularMarketTime"),
-                        "warning": "Yahoo quote timing and delay status are provider-dependent.",
-                    },
-                }
-                price = quote["price"]
-                prev = quote["previous_close"]
-                if price and prev and prev > 0:
-                    quote["change_pct"] = round((price - prev) / prev * 100, 2)
-                quotes.append(quote)
+                quotes.append(future.result())
             except Exception as e:
                 errors.append({"symbol": sym, "error": str(e)})
 
@@ -1,12 +1,17 @@
 """Reddit-related MCP tool registrations."""
 from __future__ import annotations
 
-from reddit_data import fetch_reddit_post_comments, fetch_reddit_posts
+from reddit_data import fetch_reddit_post_comments, fetch_reddit_posts, get_reddit_session, split_subreddits
 from reddit_sentiment import (
     get_reddit_sentiment_snapshot as build_reddit_sentiment_snapshot,
     get_reddit_symbol_mentions as build_reddit_symbol_mentions,
     get_reddit_trending_tickers as build_reddit_trending_tickers,
 )
+from tool_cache import cached_tool_call
+
+
+# Shared keep-alive pool so back-to-back Reddit tool calls skip the TLS handshake.
+_REDDIT_SESSION = get_reddit_session()
 
 
 def register_reddit_tools(mcp) -> None:
@@ -19,13 +24,18 @@ def register_reddit_tools(mcp) -> None:
         limit: int = 50,
     ) -> dict:
         """Fetch recent Reddit posts for a query across one or more subreddits."""
+        subs = split_subreddits(str(subreddits or ""))
         try:
-            payload = fetch_reddit_posts(
-                query=query,
-                subreddits=subreddits,
-                sort=sort,
-                time_filter=time_filter,
-                limit=limit,
+            payload = cached_tool_call(
+                ("reddit_posts", query, subs, sort, time_filter, limit),
+                lambda: fetch_reddit_posts(
+                    query=query,
+                    subreddits=subs,
+                    sort=sort,
+                    time_filter=time_filter,
+                    limit=limit,
+                    session=_REDDIT_SESSION,
+                ),
             )
             posts = payload.get("posts", [])
             lines = [f"Fetched {len(posts)} Reddit posts for query: {query}"]
@@ -41,7 +51,7 @@ def register_reddit_tools(mcp) -> None:
                 "posts": [],
                 "meta": {
                     "query": query,
-                    "subreddits": [s.strip() for s in str(subreddits).split(",") if s.strip()],
+                    "subreddits": list(subs),
                     "sort": sort,
                     "time_filter": time_filter,
                     "limit": limit,
@@ -54,7 +64,12 @@ def register_reddit_tools(mcp) -> None:
     def get_reddit_post_comments(post_id: str, sort: str = "top", limit: int = 100) -> dict:
         """Fetch comments for a Reddit post by post id."""
         try:
-            payload = fetch_reddit_post_comments(post_id=post_id, sort=sort, limit=limit)
+            payload = cached_tool_call(
+                ("reddit_comments", post_id, sort, limit),
+                lambda: fetch_reddit_post_comments(
+                    post_id=post_id, sort=sort, limit=limit, session=_REDDIT_SESSION
+                ),
+            )
             comments = payload.get("comments", [])
             lines = [f"Fetched {len(comments)} comments for post {post_id}."]
             for comment in comments[:5]:
@@ -79,12 +94,16 @@ def register_reddit_tools(mcp) -> None:
     ) -> dict:
         """Extract ticker mention counts and context from Reddit posts/comments."""
         try:
-            return build_reddit_symbol_mentions(
-                symbols=symbols,
-                subreddits=subreddits,
-                lookback_hours=lookback_hours,
-                include_comments=include_comments,
-                limit_posts=limit_posts,
+            return cached_tool_call(
+                ("reddit_mentions", str(symbols).upper(), subreddits, lookback_hours, include_comments, limit_posts),
+                lambda: build_reddit_symbol_mentions(
+                    symbols=symbols,
+                    subreddits=subreddits,
+                    lookback_hours=lookback_hours,
+                    include_comments=include_comments,
+                    limit_posts=limit_posts,
+                    session=_REDDIT_SESSION,
+                ),
             )
         except Exception as e:
             return {
@@ -105,12 +124,16 @@ def register_reddit_tools(mcp) -> None:
     ) -> dict:
         """Compute a normalized Reddit sentiment factor per symbol."""
         try:
-            return build_reddit_sentiment_snapshot(
-                symbols=symbols,
-                subreddits=subreddits,
-                lookback_hours=lookback_hours,
-                baseline_days=baseline_days,
-                limit_posts=limit_posts,
+            return cached_tool_call(
+                ("reddit_sentiment", str(symbols).upper(), subreddits, lookback_hours, baseline_days, limit_posts),
+                lambda: build_reddit_sentiment_snapshot(
+                    symbols=symbols,
+                    subreddits=subreddits,
+                    lookback_hours=lookback_hours,
+                    baseline_days=baseline_days,
+                    limit_posts=limit_posts,
+                    session=_REDDIT_SESSION,
+                ),
             )
         except Exception as e:
             return {
@@ -131,12 +154,16 @@ def register_reddit_tools(mcp) -> None:
     ) -> dict:
         """Compute Reddit sentiment for a manual comma-separated ticker list."""
         try:
-            return build_reddit_sentiment_snapshot(
-                symbols=tickers,
-                subreddits=subreddits,
-                lookback_hours=lookback_hours,
-                baseline_days=baseline_days,
-                limit_posts=limit_posts,
+            return cached_tool_call(
+                ("reddit_sentiment", str(tickers).upper(), subreddits, lookback_hours, baseline_days, limit_posts),
+                lambda: build_reddit_sentiment_snapshot(
+                    symbols=tickers,
+                    subreddits=subreddits,
+                    lookback_hours=lookback_hours,
+                    baseline_days=baseline_days,
+                    limit_posts=limit_posts,
+                    session=_REDDIT_SESSION,
+                ),
             )
         except Exception as e:
             return {
@@ -156,11 +183,15 @@ def register_reddit_tools(mcp) -> None:
     ) -> dict:
         """Find fast-rising ticker mentions on Reddit."""
         try:
-            return build_reddit_trending_tickers(
-                subreddits=subreddits,
-                lookback_hours=lookback_hours,
-                min_mentions=min_mentions,
-                limit=limit,
+            return cached_tool_call(
+                ("reddit_trending", subreddits, lookback_hours, min_mentions, limit),
+                lambda: build_reddit_trending_tickers(
+                    subreddits=subreddits,
+                    lookback_hours=lookback_hours,
+                    min_mentions=min_mentions,
+                    limit=limit,
+                    session=_REDDIT_SESSION,
+                ),
             )
         except Exception as e:
             return {
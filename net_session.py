@@ -0,0 +1,53 @@
+"""Connection pooling for the robin_stocks HTTP session.
+
+robin_stocks routes every call through one module-global ``requests.Session``
+whose default adapter keeps only 10 connections per host and never retries.
+Importing this module mounts a larger keep-alive pool with a small idempotent
+retry budget on that same session object, so the auth headers robin_stocks
+sets on it are preserved and parallel pre-trade fetches reuse warm sockets.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+
+try:
+    from urllib3.util.retry import Retry  # type: ignore
+except Exception:
+    Retry = None  # type: ignore[assignment]
+
+try:
+    from robin_stocks.robinhood.globals import SESSION as _RH_SESSION
+except Exception:
+    _RH_SESSION = None
+
+_POOL_SIZE = 20
+
+
+def _build_adapter() -> HTTPAdapter:
+    retry: Any = 0
+    if Retry is not None:
+        # GET/DELETE only: order POSTs must never be replayed automatically.
+        retry = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "DELETE"]),
+            raise_on_status=False,
+        )
+    return HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=retry)
+
+
+def configure_robinhood_session(session: Any = None) -> bool:
+    """Mount the pooled adapter on the robin_stocks session; returns False if unavailable."""
+    target = session if session is not None else _RH_SESSION
+    if target is None or not hasattr(target, "mount"):
+        return False
+    adapter = _build_adapter()
+    target.mount("http://", adapter)
+    target.mount("https://", adapter)
+    return True
+
+
+configure_robinhood_session()
@@ -1,6 +1,8 @@
 """Shared helpers for option-chain normalization and filtering."""
 from __future__ import annotations
 
+import heapq
+from operator import itemgetter
 from typing import Any
 
 
@@ -35,14 +37,16 @@ def select_nearby_strikes(options: list[dict], current_price: float, strikes: in
     limit = max(0, int(strikes or 0))
     price = to_float(current_price, 0.0)
 
-    valid_options = [opt for opt in options if to_float(opt.get("strike"), 0.0) > 0]
-    below = sorted(
-        [opt for opt in valid_options if to_float(opt.get("strike"), 0.0) < price],
-        key=lambda opt: to_float(opt.get("strike"), 0.0),
-        reverse=True,
-    )[:limit]
-    above = sorted(
-        [opt for opt in valid_options if to_float(opt.get("strike"), 0.0) >= price],
-        key=lambda opt: to_float(opt.get("strike"), 0.0),
-    )[:limit]
-    return sorted(below + above, key=lambda opt: to_float(opt.get("strike"), 0.0))
+    # One pass parses each strike once and partitions around the price.
+    below: list[tuple[float, dict]] = []
+    above: list[tuple[float, dict]] = []
+    for opt in options:
+        strike = to_float(opt.get("strike"), 0.0)
+        if strike <= 0:
+            continue
+        (below if strike < price else above).append((strike, opt))
+
+    # Only `limit` strikes per side survive, so partial selection beats a full sort.
+    by_strike = itemgetter(0)
+    nearest = heapq.nlargest(limit, below, key=by_strike) + heapq.nsmallest(limit, above, key=by_strike)
+    return [opt for _, opt in sorted(nearest, key=by_strike)]
@@ -7,13 +7,33 @@ from typing import Any
 
 import robin_stocks.robinhood as rh
 
+import net_session  # noqa: F401  (pools robin_stocks connections)
+
 
 class OrderValidationError(ValueError):
     pass
 
 
+_SIDES = frozenset({"buy", "sell"})
+
+# (order_type, side) -> (robin_stocks function name, takes limit price, takes stop price).
+# Functions are looked up on ``rh`` at call time so tests can patch them.
+_DISPATCH: dict[tuple[str, str], tuple[str, bool, bool]] = {
+    ("market", "buy"): ("order_buy_fractional_by_quantity", False, False),
+    ("market", "sell"): ("order_sell_fractional_by_quantity", False, False),
+    ("limit", "buy"): ("order_buy_limit", True, False),
+    ("limit", "sell"): ("order_sell_limit", True, False),
+    ("stop_loss", "buy"): ("order_buy_stop_loss", False, True),
+    ("stop_loss", "sell"): ("order_sell_stop_loss", False, True),
+    ("stop_limit", "buy"): ("order_buy_stop_limit", True, True),
+    ("stop_limit", "sell"): ("order_sell_stop_limit", True, True),
+    ("trailing_stop", "buy"): ("order_buy_trailing_stop", False, True),
+    ("trailing_stop", "sell"): ("order_sell_trailing_stop", False, True),
+}
+
+
 def validate_order(symbol: str, qty: float, side: str, order_type: str, price: float | None, stop_price: float | None = None) -> None:
-    if side not in {"buy", "sell"}:
+    if side not in _SIDES:
         raise OrderValidationError("--side must be 'buy' or 'sell'.")
     if order_type == "limit" and price is None:
         raise OrderValidationError("Limit orders require --price.")
@@ -32,35 +52,13 @@ def place_order(symbol: str, qty: float, side: str, order_type: str, price: floa
                 extended_hours: bool = False) -> dict[str, Any]:
     validate_order(symbol, qty, side, order_type, price, stop_price)
 
-    if order_type == "market":
-        if side == "buy":
-            return rh.order_buy_fractional_by_quantity(symbol, qty, timeInForce=time_in_force, extendedHours=extended_hours)
-        else:
-            return rh.order_sell_fractional_by_quantity(symbol, qty, timeInForce=time_in_force, extendedHours=extended_hours)
-
-    elif order_type == "limit":
-        if side == "buy":
-            return rh.order_buy_limit(symbol, qty, price, timeInForce=time_in_force, extendedHours=extended_hours)
-        else:
-            return rh.order_sell_limit(symbol, qty, price, timeInForce=time_in_force, extendedHours=extended_hours)
-
-    elif order_type == "stop_loss":
-        if side == "buy":
-            return rh.order_buy_stop_loss(symbol, qty, stop_price, timeInForce=time_in_force, extendedHours=extended_hours)
-        else:
-            return rh.order_sell_stop_loss(symbol, qty, stop_price, timeInForce=time_in_force, extendedHours=extended_hours)
-
-    elif order_type == "stop_limit":
-        if side == "buy":
-            return rh.order_buy_stop_limit(symbol, qty, price, stop_price, timeInForce=time_in_force, extendedHours=extended_hours)
-        else:
-            return rh.order_sell_stop_limit(symbol, qty, price, stop_price, timeInForce=time_in_force, extendedHours=extended_hours)
-
-    elif order_type == "trailing_stop":
-        if side == "buy":
-            return rh.order_buy_trailing_stop(symbol, qty, stop_price, timeInForce=time_in_force, extendedHours=extended_hours)
-        else:
-            return rh.order_sell_trailing_stop(symbol, qty, stop_price, timeInForce=time_in_force, extendedHours=extended_hours)
-
-    else:
+    entry = _DISPATCH.get((order_type, side))
+    if entry is None:
         raise OrderValidationError(f"Unknown order_type: {order_type}. Use: market, limit, stop_loss, stop_limit, trailing_stop.")
+    fn_name, needs_price, needs_stop = entry
+    args: list[Any] = [symbol, qty]
+    if needs_price:
+        args.append(price)
+    if needs_stop:
+        args.append(stop_price)
+    return getattr(rh, fn_name)(*args, timeInForce=time_in_force, extendedHours=extended_hours)
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 """Portfolio helpers for Robinhood CLI."""
 from __future__ import annotations
+import threading
 import robin_stocks.robinhood as rh
 from typing import List, Dict, Any
 
+import net_session  # noqa: F401  (pools robin_stocks connections)
+from quote_cache import get_fundamentals_cached, get_quotes_cached
+
 def list_positions() -> List[Dict[str, Any]]:
     """
     Fetch open positions with detailed metrics using build_holdings.
@@ -33,7 +37,7 @@ def list_positions() -> List[Dict[str, Any]]:
     
     if symbols:
         try:
-            funds = rh.get_fundamentals(symbols)
+            funds = get_fundamentals_cached(symbols)
             for f in funds:
                 if f and 'symbol' in f:
                     fundamentals_map[f['symbol']] = f
@@ -42,7 +46,7 @@ def list_positions() -> List[Dict[str, Any]]:
             
         try:
             # Fetch quotes to manually calculate intraday P/L if needed (build_holdings can be stale/zero)
-            qs = rh.get_quotes(symbols)
+            qs = get_quotes_cached(symbols)
             for q in qs:
                 if q and 'symbol' in q:
                     quotes_map[q['symbol']] = q
@@ -51,37 +55,32 @@ def list_positions() -> List[Dict[str, Any]]:
 
     results = []
     for symbol, data in holdings.items():
+        # Parse each holdings field once; the dict below reuses these locals.
+        quantity = float(data.get('quantity', 0))
+        average_buy_price = float(data.get('average_buy_price', 0))
+        percent_change = float(data.get('percent_change', 0))
+        equity_change = float(data.get('equity_change', 0))
         current_price = float(data.get('price', 0) or 0)
         current_equity = float(data.get('equity', 0) or 0)
         intraday_pct = float(data.get('intraday_percent_change', 0) or 0)
         intraday_pl = 0.0
         try:
-            intraday_pl_raw = data.get('intraday_profit_loss')
             quote = quotes_map.get(symbol)
+            prev_close = 0.0
             if quote:
                 last_price = float(quote.get('last_trade_price', 0))
                 prev_close = float(quote.get('adjusted_previous_close') or quote.get('previous_close', 0))
-                quantity = float(data.get('quantity', 0))
-
-                if prev_close > 0:
-                    intraday_pl = (last_price - prev_close) * quantity
-                    intraday_pct = ((last_price - prev_close) / prev_close) * 100
-                    current_price = last_price
-                    current_equity = current_price * quantity
-                else:
-                    if intraday_pl_raw is not None:
-                        intraday_pl = float(intraday_pl_raw)
-                    elif intraday_pct == 0:
-                        intraday_pl = 0.0
-                    else:
-                        prev_equity = current_equity / (1 + (intraday_pct / 100))
-                        intraday_pl = current_equity - prev_equity
+
+            if prev_close > 0:
+                intraday_pl = (last_price - prev_close) * quantity
+                intraday_pct = ((last_price - prev_close) / prev_close) * 100
+                current_price = last_price
+                current_equity = current_price * quantity
             else:
+                intraday_pl_raw = data.get('intraday_profit_loss')
                 if intraday_pl_raw is not None:
                     intraday_pl = float(intraday_pl_raw)
-                elif intraday_pct == 0:
-                    intraday_pl = 0.0
-                else:
+                elif intraday_pct != 0:
                     prev_equity = current_equity / (1 + (intraday_pct / 100))
                     intraday_pl = current_equity - prev_equity
         except (ValueError, TypeError):
@@ -114,12 +113,12 @@ def list_positions() -> List[Dict[str, Any]]:
         pos = {
             "symbol": symbol,
             "name": data.get("name"),
-            "quantity": float(data.get("quantity", 0)),
-            "average_buy_price": float(data.get("average_buy_price", 0)),
+            "quantity": quantity,
+            "average_buy_price": average_buy_price,
             "price": current_price,
             "equity": current_equity,
-            "percent_change": float(data.get("percent_change", 0)),
-            "equity_change": float(data.get("equity_change", 0)),
+            "percent_change": percent_change,
+            "equity_change": equity_change,
             "intraday_percent_change": intraday_pct,
             "intraday_profit_loss": intraday_pl,
             "instrument_id": data.get("id"), # This is usually the instrument ID in build_holdings
@@ -136,6 +135,84 @@ def list_positions() -> List[Dict[str, Any]]:
         
     return results
 
+# Instrument URLs never change symbol, so resolved symbols are kept for the
+# process. Failed lookups are not stored and are retried on the next call.
+_INSTRUMENT_SYMBOLS: Dict[str, str] = {}
+_INSTRUMENT_LOCK = threading.Lock()
+
+
+def _symbol_for_instrument(instrument_url: str) -> str:
+    with _INSTRUMENT_LOCK:
+        cached = _INSTRUMENT_SYMBOLS.get(instrument_url)
+    if cached:
+        return cached
+    try:
+        symbol = str(rh.get_symbol_by_url(instrument_url) or "").upper()
+    except Exception:
+        symbol = ""
+    if symbol:
+        with _INSTRUMENT_LOCK:
+            _INSTRUMENT_SYMBOLS[instrument_url] = symbol
+    return symbol
+
+
+def list_position_exposures() -> List[Dict[str, Any]]:
+    """
+    Fetch a lightweight view of open positions for risk checks.
+
+    Skips build_holdings (which makes several requests per position) and the
+    fundamentals batch: reads open positions, resolves symbols through a
+    memoized instrument lookup, and prices everything with one quote batch.
+
+    Positions whose instrument cannot be resolved are still returned, with an
+    empty symbol and valued at average_buy_price, so exposure is never dropped.
+
+    Returns:
+        List of dictionaries containing symbol, quantity, price, equity and
+        intraday_profit_loss.
+    """
+    rows = []
+    for item in rh.get_open_stock_positions() or []:
+        if not item:
+            continue
+        quantity = float(item.get('quantity') or 0)
+        if quantity == 0:
+            continue
+        symbol = str(item.get('symbol') or '').upper()
+        if not symbol and item.get('instrument'):
+            symbol = _symbol_for_instrument(item['instrument'])
+        rows.append((symbol, quantity, float(item.get('average_buy_price') or 0)))
+
+    quotes_map = {}
+    symbols = [symbol for symbol, _, _ in rows if symbol]
+    if symbols:
+        try:
+            for q in get_quotes_cached(symbols):
+                quotes_map[q['symbol']] = q
+        except Exception:
+            pass
+
+    results = []
+    for symbol, quantity, average_buy_price in rows:
+        quote = quotes_map.get(symbol) or {}
+        try:
+            price = float(quote.get('last_trade_price') or 0)
+            prev_close = float(quote.get('adjusted_previous_close') or quote.get('previous_close') or 0)
+        except (TypeError, ValueError):
+            price, prev_close = 0.0, 0.0
+        if price <= 0:
+            # No usable quote: value at cost so exposure is never understated as zero.
+            price, prev_close = average_buy_price, 0.0
+        results.append({
+            "symbol": symbol,
+            "quantity": quantity,
+            "price": price,
+            "equity": price * quantity,
+            "intraday_profit_loss": (price - prev_close) * quantity if prev_close > 0 else 0.0,
+        })
+    return results
+
+
 def get_dividends(instrument_id: str) -> List[Dict[str, Any]]:
     """Fetch dividends for a specific instrument."""
     try:
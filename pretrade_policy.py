@@ -1,22 +1,72 @@
 """Pre-trade policy checks for MCP order execution."""
 from __future__ import annotations
 
+import json
 import os
-from typing import Any
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
 
 import robin_stocks.robinhood as rh
 
 from account import get_account_profile
 from market_calendar import get_market_status
-from portfolio import list_positions
+import net_session  # noqa: F401  (pools robin_stocks connections)
+from portfolio import list_position_exposures
+from quote_cache import get_quotes_cached
 from reddit_sentiment import get_reddit_sentiment_snapshot
 
+# Internal check record; expanded to the public {name, status, detail} dict on return.
+_Check = namedtuple("_Check", "name passed detail")
+
 DEFAULT_HARD_EXCLUDE_SYMBOLS = {"AMD", "AVGO", "CEG", "GOOG", "NVDA", "SLV"}
+_PREFETCH_TIMEOUT_SECONDS = 20
+# The Reddit scrape was never time-limited when it ran inline; allow it far longer.
+_SENTIMENT_TIMEOUT_SECONDS = 120
+
+# Instrument URLs are immutable, so resolved symbols are cached for good.
+_INSTRUMENT_SYMBOL_CACHE_PATH = Path(
+    os.getenv(
+        "ROBIN_INSTRUMENT_CACHE_PATH",
+        str(Path.home() / ".robinhood-cli" / "instrument_symbols.json"),
+    )
+).expanduser()
+_INSTRUMENT_SYMBOL_CACHE: dict[str, str] | None = None
+_INSTRUMENT_LOCK = threading.Lock()
+
+# Sentiment snapshots are cached per symbol and refreshed in the background once
+# older than the refresh interval, so the order path reads a recent value instead
+# of scraping Reddit on every buy. Entries past the max age are refetched inline.
+_SENTIMENT_REFRESH_SECONDS = max(0.0, float(os.getenv("ROBIN_SENTIMENT_REFRESH_SECONDS", "60")))
+_SENTIMENT_MAX_AGE_SECONDS = 600.0
+_SENTIMENT_CACHE: dict[str, tuple[float, dict]] = {}
+_SENTIMENT_REFRESHING: set[str] = set()
+_SENTIMENT_LOCK = threading.Lock()
+_SENTIMENT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pretrade-sentiment")
+
+# Shared pool for the independent account/positions/orders/market/quote/sentiment
+# round-trips so each evaluation waits on the slowest call rather than their sum.
+_PREFETCH_WORKERS = 6
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS, thread_name_prefix="pretrade")
+# Futures that timed out while already running; they still hold a worker.
+_STALLED_PREFETCHES: set[Future] = set()
+_STALLED_LOCK = threading.Lock()
 
 
 def _to_float(value: Any, default: float = 0.0) -> float:
+    # Most inputs are already numeric; check exact types before paying for try/except.
+    kind = type(value)
+    if kind is float:
+        return value
+    if kind is int:
+        return float(value)
     try:
-        if value in ("", None):
+        if value is None or value == "":
             return float(default)
         return float(value)
     except (TypeError, ValueError):
@@ -53,30 +103,261 @@ def _get_symbol_set_env(name: str, default: set[str]) -> set[str]:
     return cleaned if cleaned else set(default)
 
 
-def _first_quote_price(symbol: str) -> float:
+_POLICY_ENV_NAMES = (
+    "ROBIN_MAX_DAILY_LOSS_PCT",
+    "ROBIN_MAX_ORDER_NOTIONAL_PCT",
+    "ROBIN_MAX_SYMBOL_EXPOSURE_PCT",
+    "ROBIN_MAX_PENDING_ORDERS_PER_SYMBOL",
+    "ROBIN_ENABLE_SENTIMENT_GUARDRAIL",
+    "ROBIN_SENTIMENT_FAIL_CLOSED",
+    "ROBIN_SENTIMENT_CONFIDENCE_FLOOR",
+    "ROBIN_ENABLE_HARD_EXCLUDE",
+    "ROBIN_HARD_EXCLUDE_SYMBOLS",
+)
+
+
+@dataclass(frozen=True)
+class _PolicyConfig:
+    max_daily_loss_pct: float
+    max_order_notional_pct: float
+    max_symbol_exposure_pct: float
+    max_pending_orders_per_symbol: int
+    enable_sentiment_guardrail: bool
+    sentiment_fail_closed: bool
+    sentiment_confidence_floor: float
+    enable_hard_exclude: bool
+    hard_exclude_symbols: frozenset[str]
+    # Sorted views of hard_exclude_symbols for check details and the limits dict.
+    hard_exclude_sorted: tuple[str, ...]
+    hard_exclude_csv: str
+
+
+_POLICY: _PolicyConfig | None = None
+_POLICY_ENV_SNAPSHOT: tuple | None = None
+
+
+def _load_policy_env() -> _PolicyConfig:
+    hard_exclude_symbols = frozenset(
+        _get_symbol_set_env("ROBIN_HARD_EXCLUDE_SYMBOLS", DEFAULT_HARD_EXCLUDE_SYMBOLS)
+    )
+    hard_exclude_sorted = tuple(sorted(hard_exclude_symbols))
+    return _PolicyConfig(
+        max_daily_loss_pct=_get_float_env("ROBIN_MAX_DAILY_LOSS_PCT", 0.03),
+        max_order_notional_pct=_get_float_env("ROBIN_MAX_ORDER_NOTIONAL_PCT", 0.15),
+        max_symbol_exposure_pct=_get_float_env("ROBIN_MAX_SYMBOL_EXPOSURE_PCT", 0.30),
+        max_pending_orders_per_symbol=_get_int_env("ROBIN_MAX_PENDING_ORDERS_PER_SYMBOL", 3),
+        enable_sentiment_guardrail=_is_truthy_env("ROBIN_ENABLE_SENTIMENT_GUARDRAIL", True),
+        sentiment_fail_closed=_is_truthy_env("ROBIN_SENTIMENT_FAIL_CLOSED", True),
+        sentiment_confidence_floor=_get_float_env("ROBIN_SENTIMENT_CONFIDENCE_FLOOR", 0.45),
+        enable_hard_exclude=_is_truthy_env("ROBIN_ENABLE_HARD_EXCLUDE", True),
+        hard_exclude_symbols=hard_exclude_symbols,
+        hard_exclude_sorted=hard_exclude_sorted,
+        hard_exclude_csv=",".join(hard_exclude_sorted),
+    )
+
+
+def reload_policy() -> _PolicyConfig:
+    """Re-read the ROBIN_* policy environment variables."""
+    global _POLICY, _POLICY_ENV_SNAPSHOT
+    _POLICY_ENV_SNAPSHOT = tuple(os.environ.get(name) for name in _POLICY_ENV_NAMES)
+    _POLICY = _load_policy_env()
+    return _POLICY
+
+
+def _current_policy() -> _PolicyConfig:
+    # Raw env lookups are cheap dict reads; only re-parse when a value changed
+    # (e.g. .env loaded after import, or tests patching os.environ).
+    snapshot = tuple(os.environ.get(name) for name in _POLICY_ENV_NAMES)
+    if _POLICY is None or snapshot != _POLICY_ENV_SNAPSHOT:
+        return reload_policy()
+    return _POLICY
+
+
+def _batch_quote_prices(symbols: list[str]) -> dict[str, float]:
+    """Reference price per symbol from one batched quote call (missing symbols omitted)."""
+    prices: dict[str, float] = {}
     try:
-        quotes = rh.get_quotes(symbol.upper()) or []
-        if quotes and isinstance(quotes[0], dict):
-            quote = quotes[0]
+        for quote in get_quotes_cached(symbols) or []:
+            if not isinstance(quote, dict):
+                continue
             for field in ("last_trade_price", "ask_price", "bid_price", "previous_close"):
                 price = _to_float(quote.get(field), 0.0)
                 if price > 0:
-                    return price
+                    prices[str(quote.get("symbol") or "").upper()] = price
+                    break
     except Exception:
-        return 0.0
-    return 0.0
+        return {}
+    return prices
 
 
-def _resolve_open_order_symbol(order: dict) -> str:
-    order_symbol = str(order.get("symbol") or "").upper().strip()
-    if order_symbol:
-        return order_symbol
+def _first_quote_price(symbol: str) -> float:
+    symbol_up = symbol.upper()
+    return _batch_quote_prices([symbol_up]).get(symbol_up, 0.0)
+
+
+def _prefetch_submit(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Submit to the shared pool, or run inline once stalled calls hold most workers."""
+    with _STALLED_LOCK:
+        saturated = len(_STALLED_PREFETCHES) >= _PREFETCH_WORKERS - 1
+    if not saturated:
+        return _PREFETCH_EXECUTOR.submit(fn, *args, **kwargs)
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _forget_stalled(future: Future) -> None:
+    with _STALLED_LOCK:
+        _STALLED_PREFETCHES.discard(future)
+
+
+def _await_prefetch(future: Future, timeout: float) -> Any:
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        if not future.cancel():
+            with _STALLED_LOCK:
+                _STALLED_PREFETCHES.add(future)
+            future.add_done_callback(_forget_stalled)
+        raise
+
+
+def _prefetch_result(
+    future: Future | None,
+    default: Callable[[], Any],
+    timeout: float = _PREFETCH_TIMEOUT_SECONDS,
+) -> Any:
+    if future is None:
+        return default()
+    try:
+        return _await_prefetch(future, timeout)
+    except Exception:
+        return default()
+
+
+def _sentiment_snapshot(symbol: str) -> dict:
+    return get_reddit_sentiment_snapshot(
+        symbols=symbol,
+        lookback_hours=24,
+        baseline_days=30,
+        limit_posts=120,
+    )
+
+
+def _instrument_symbol_cache() -> dict[str, str]:
+    global _INSTRUMENT_SYMBOL_CACHE
+    if _INSTRUMENT_SYMBOL_CACHE is None:
+        try:
+            loaded = json.loads(_INSTRUMENT_SYMBOL_CACHE_PATH.read_text())
+            _INSTRUMENT_SYMBOL_CACHE = {
+                str(url): str(sym) for url, sym in loaded.items() if url and sym
+            } if isinstance(loaded, dict) else {}
+        except Exception:
+            _INSTRUMENT_SYMBOL_CACHE = {}
+    return _INSTRUMENT_SYMBOL_CACHE
+
+
+def _save_instrument_symbol_cache(cache: dict[str, str]) -> None:
+    try:
+        _INSTRUMENT_SYMBOL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _INSTRUMENT_SYMBOL_CACHE_PATH.write_text(json.dumps(cache))
+    except Exception:
+        # Cache write failures should never block order evaluation.
+        return
+
+
+def _lookup_instrument_symbol(instrument_url: str) -> str:
     try:
-        return str(rh.get_symbol_by_url(order.get("instrument")) or "").upper().strip()
+        return str(rh.get_symbol_by_url(instrument_url) or "").upper().strip()
     except Exception:
         return ""
 
 
+def _resolve_instrument_symbols(instrument_urls: set[str]) -> dict[str, str]:
+    """Map instrument URLs to symbols, fetching all cache misses in parallel."""
+    if not instrument_urls:
+        return {}
+    with _INSTRUMENT_LOCK:
+        cache = _instrument_symbol_cache()
+        misses = [url for url in instrument_urls if url not in cache]
+    if misses:
+        futures = [_prefetch_submit(_lookup_instrument_symbol, url) for url in misses]
+        resolved = {url: _prefetch_result(future, str) for url, future in zip(misses, futures)}
+        with _INSTRUMENT_LOCK:
+            cache.update({url: sym for url, sym in resolved.items() if sym})
+            snapshot = dict(cache)
+        if any(resolved.values()):
+            _save_instrument_symbol_cache(snapshot)
+    return {url: cache.get(url, "") for url in instrument_urls}
+
+
+def _is_cacheable_sentiment(snapshot: object) -> bool:
+    """Only usable snapshots are cached; failed or empty ones are refetched next call."""
+    return isinstance(snapshot, dict) and not snapshot.get("error") and bool(snapshot.get("symbols"))
+
+
+def _refresh_sentiment(symbol: str) -> None:
+    try:
+        snapshot = _sentiment_snapshot(symbol)
+    except Exception:
+        # Keep serving the previous entry; it is refetched inline once too old.
+        snapshot = None
+    with _SENTIMENT_LOCK:
+        if _is_cacheable_sentiment(snapshot):
+            _SENTIMENT_CACHE[symbol] = (time.monotonic(), snapshot)
+        _SENTIMENT_REFRESHING.discard(symbol)
+
+
+def _cached_sentiment_snapshot(symbol: str) -> dict:
+    """
+    Sentiment snapshot served from a per-symbol cache.
+
+    Missing or expired entries are fetched synchronously, so fetch errors still
+    reach the fail-closed handling. Entries older than the refresh interval are
+    returned as-is while one refresh per symbol runs on a small dedicated pool.
+    """
+    if _SENTIMENT_REFRESH_SECONDS <= 0:
+        return _sentiment_snapshot(symbol)
+
+    now = time.monotonic()
+    with _SENTIMENT_LOCK:
+        item = _SENTIMENT_CACHE.get(symbol)
+        age = now - item[0] if item else None
+        refresh = (
+            age is not None
+            and _SENTIMENT_REFRESH_SECONDS <= age < _SENTIMENT_MAX_AGE_SECONDS
+            and symbol not in _SENTIMENT_REFRESHING
+        )
+        if refresh:
+            _SENTIMENT_REFRESHING.add(symbol)
+    if refresh:
+        _SENTIMENT_EXECUTOR.submit(_refresh_sentiment, symbol)
+    if age is not None and age < _SENTIMENT_MAX_AGE_SECONDS:
+        return item[1]
+
+    snapshot = _sentiment_snapshot(symbol)
+    if _is_cacheable_sentiment(snapshot):
+        with _SENTIMENT_LOCK:
+            _SENTIMENT_CACHE[symbol] = (time.monotonic(), snapshot)
+    return snapshot
+
+
+def clear_sentiment_cache() -> None:
+    """Drop all cached sentiment snapshots."""
+    with _SENTIMENT_LOCK:
+        _SENTIMENT_CACHE.clear()
+
+
+def _resolve_open_order_symbol(order: dict, instrument_symbols: dict[str, str]) -> str:
+    order_symbol = str(order.get("symbol") or "").upper().strip()
+    if order_symbol:
+        return order_symbol
+    return instrument_symbols.get(order.get("instrument") or "", "")
+
+
 def evaluate_pretrade_policy(
     *,
     symbol: str,
@@ -86,10 +367,16 @@ def evaluate_pretrade_policy(
     price: float | None,
     extended_hours: bool,
     asset_class: str = "stock",
+    fail_fast: bool = True,
 ) -> dict:
     """
     Evaluate policy gates before order submission.
 
+    With ``fail_fast`` (default) evaluation stops recording checks at the first
+    blocker: a hard-exclude hit skips every network fetch and the Reddit
+    sentiment snapshot is only fetched once all other gates pass. Pass
+    ``fail_fast=False`` to evaluate and report every check for auditing.
+
     Returns:
         {
           "allowed": bool,
@@ -105,27 +392,30 @@ def evaluate_pretrade_policy(
     if asset_class_lc not in {"stock", "crypto"}:
         asset_class_lc = "stock"
 
-    max_daily_loss_pct = _get_float_env("ROBIN_MAX_DAILY_LOSS_PCT", 0.03)
-    max_order_notional_pct = _get_float_env("ROBIN_MAX_ORDER_NOTIONAL_PCT", 0.15)
-    max_symbol_exposure_pct = _get_float_env("ROBIN_MAX_SYMBOL_EXPOSURE_PCT", 0.30)
-    max_pending_orders_per_symbol = _get_int_env("ROBIN_MAX_PENDING_ORDERS_PER_SYMBOL", 3)
-    enable_sentiment_guardrail = _is_truthy_env("ROBIN_ENABLE_SENTIMENT_GUARDRAIL", True)
-    sentiment_fail_closed = _is_truthy_env("ROBIN_SENTIMENT_FAIL_CLOSED", True)
-    sentiment_confidence_floor = _get_float_env("ROBIN_SENTIMENT_CONFIDENCE_FLOOR", 0.45)
-    enable_hard_exclude = _is_truthy_env("ROBIN_ENABLE_HARD_EXCLUDE", True)
-    hard_exclude_symbols = _get_symbol_set_env("ROBIN_HARD_EXCLUDE_SYMBOLS", DEFAULT_HARD_EXCLUDE_SYMBOLS)
-
-    checks: list[dict[str, str]] = []
+    policy = _current_policy()
+    max_daily_loss_pct: float = policy.max_daily_loss_pct
+    max_order_notional_pct: float = policy.max_order_notional_pct
+    max_symbol_exposure_pct: float = policy.max_symbol_exposure_pct
+    max_pending_orders_per_symbol: int = policy.max_pending_orders_per_symbol
+    enable_sentiment_guardrail: bool = policy.enable_sentiment_guardrail
+    sentiment_fail_closed: bool = policy.sentiment_fail_closed
+    sentiment_confidence_floor: float = policy.sentiment_confidence_floor
+    enable_hard_exclude: bool = policy.enable_hard_exclude
+    hard_exclude_symbols: frozenset[str] = policy.hard_exclude_symbols
+
+    checks: list[_Check] = []
     blocked_by: str | None = None
 
     def add_check(name: str, passed: bool, detail: str) -> None:
         nonlocal blocked_by
-        checks.append({"name": name, "status": "pass" if passed else "fail", "detail": detail})
+        if fail_fast and blocked_by is not None:
+            return
+        checks.append(_Check(name, passed, detail))
         if not passed and blocked_by is None:
             blocked_by = name
 
     # Fail closed for configured do-not-trade symbols at execution time.
-    hard_exclude_hit = (
+    hard_exclude_hit: bool = (
         asset_class_lc == "stock"
         and enable_hard_exclude
         and symbol_up in hard_exclude_symbols
@@ -137,52 +427,63 @@ def evaluate_pretrade_policy(
         (
             f"asset_class={asset_class_lc}, symbol={symbol_up}, side={side_lc}, "
             f"enabled={int(enable_hard_exclude)}, "
-            f"excluded={','.join(sorted(hard_exclude_symbols))}"
+            f"excluded={policy.hard_exclude_csv}"
         ),
     )
 
-    try:
-        account = get_account_profile() or {}
-    except Exception:
-        account = {}
-    try:
-        positions = list_positions() or []
-    except Exception:
-        positions = []
-    open_orders = []
-    if asset_class_lc == "stock":
-        try:
-            open_orders = rh.get_all_open_stock_orders() or []
-        except Exception:
-            open_orders = []
-    try:
-        market = get_market_status()
-    except Exception:
-        market = {"session": "unknown"}
-
-    equity = _to_float(account.get("equity"), 0.0)
-    buying_power = _to_float(account.get("buying_power"), 0.0)
-    market_value = _to_float(account.get("market_value"), 0.0)
-    account_data_available = bool(account)
+    run_sentiment: bool = enable_sentiment_guardrail and side_lc == "buy" and asset_class_lc == "stock"
+    ref_price: float = _to_float(price, 0.0)
+    account_future = positions_future = orders_future = market_future = None
+    quote_future = sentiment_future = None
+    if not (fail_fast and blocked_by is not None):
+        submit = _prefetch_submit
+        account_future = submit(get_account_profile)
+        positions_future = submit(list_position_exposures)
+        orders_future = submit(rh.get_all_open_stock_orders) if asset_class_lc == "stock" else None
+        market_future = submit(get_market_status)
+        quote_future = submit(_first_quote_price, symbol_up) if ref_price <= 0 else None
+        if run_sentiment and not fail_fast:
+            sentiment_future = submit(_cached_sentiment_snapshot, symbol_up)
+
+    account = _prefetch_result(account_future, dict) or {}
+    positions = _prefetch_result(positions_future, list) or []
+    open_orders = _prefetch_result(orders_future, list) or []
+    market = _prefetch_result(market_future, lambda: {"session": "unknown"})
+
+    equity: float = _to_float(account.get("equity"), 0.0)
+    buying_power: float = _to_float(account.get("buying_power"), 0.0)
+    market_value: float = _to_float(account.get("market_value"), 0.0)
+    account_data_available: bool = bool(account)
     if equity <= 0:
         equity = max(0.0, buying_power + market_value)
 
-    ref_price = _to_float(price, 0.0)
     if ref_price <= 0:
-        ref_price = _first_quote_price(symbol_up)
-    order_notional = max(0.0, _to_float(qty, 0.0) * ref_price)
-
-    symbol_equity_now = sum(
-        _to_float(pos.get("equity"), 0.0)
-        for pos in positions
-        if str(pos.get("symbol", "")).upper() == symbol_up
-    )
-    pending_for_symbol = 0
-    pending_buy_notional_total = 0.0
-    pending_buy_notional_symbol = 0.0
+        ref_price = _prefetch_result(quote_future, float)
+    order_notional: float = max(0.0, _to_float(qty, 0.0) * ref_price)
+
+    # One pass over positions for both the symbol's equity and total intraday P/L.
+    symbol_equity_now: float = 0.0
+    intraday_pl_open_positions: float = 0.0
+    for pos in positions:
+        intraday_pl_open_positions += _to_float(pos.get("intraday_profit_loss"), 0.0)
+        pos_symbol = str(pos.get("symbol") or "").upper()
+        # A position whose symbol could not be resolved may be this symbol; count it (fail closed).
+        if pos_symbol == symbol_up or not pos_symbol:
+            symbol_equity_now += _to_float(pos.get("equity"), 0.0)
+    pending_for_symbol: int = 0
+    pending_buy_notional_total: float = 0.0
+    pending_buy_notional_symbol: float = 0.0
     if asset_class_lc == "stock":
+        instrument_symbols = _resolve_instrument_symbols(
+            {
+                order.get("instrument")
+                for order in open_orders
+                if order.get("instrument") and not str(order.get("symbol") or "").strip()
+            }
+        )
+        open_buys: list[tuple[str, float, float]] = []
         for order in open_orders:
-            order_symbol = _resolve_open_order_symbol(order)
+            order_symbol = _resolve_open_order_symbol(order, instrument_symbols)
             if order_symbol == symbol_up:
                 pending_for_symbol += 1
 
@@ -192,28 +493,34 @@ def evaluate_pretrade_policy(
             qty_open = _to_float(order.get("quantity"), 0.0)
             if qty_open <= 0:
                 continue
-            order_price = _to_float(order.get("price"), 0.0)
+            open_buys.append((order_symbol, qty_open, _to_float(order.get("price"), 0.0)))
+
+        # Price all unpriced (market) open buys with a single quote request.
+        unpriced = sorted({sym for sym, _, order_price in open_buys if order_price <= 0 and sym})
+        open_buy_prices = _batch_quote_prices(unpriced) if unpriced else {}
+        for order_symbol, qty_open, order_price in open_buys:
             if order_price <= 0 and order_symbol:
-                order_price = _first_quote_price(order_symbol)
+                order_price = open_buy_prices.get(order_symbol, 0.0)
             order_notional_open = max(0.0, qty_open * order_price)
             pending_buy_notional_total += order_notional_open
             if order_symbol == symbol_up:
                 pending_buy_notional_symbol += order_notional_open
 
-    available_buying_power = max(0.0, buying_power - pending_buy_notional_total)
-    symbol_equity_after = symbol_equity_now + pending_buy_notional_symbol + (order_notional if side_lc == "buy" else -order_notional)
+    available_buying_power: float = max(0.0, buying_power - pending_buy_notional_total)
+    symbol_equity_after: float = symbol_equity_now + pending_buy_notional_symbol + (order_notional if side_lc == "buy" else -order_notional)
     if symbol_equity_after < 0:
         symbol_equity_after = 0.0
 
-    intraday_pl_open_positions = sum(_to_float(pos.get("intraday_profit_loss"), 0.0) for pos in positions)
-    equity_previous_close = _to_float(account.get("equity_previous_close"), 0.0)
+    equity_previous_close: float = _to_float(account.get("equity_previous_close"), 0.0)
+    daily_pnl_total: float
+    daily_pnl_source: str
     if equity_previous_close > 0 and equity > 0:
         daily_pnl_total = equity - equity_previous_close
         daily_pnl_source = "equity_vs_previous_close"
     else:
         daily_pnl_total = intraday_pl_open_positions
         daily_pnl_source = "open_positions_intraday_sum"
-    daily_loss_breach = equity > 0 and daily_pnl_total <= -(equity * max_daily_loss_pct)
+    daily_loss_breach: bool = equity > 0 and daily_pnl_total <= -(equity * max_daily_loss_pct)
 
     add_check(
         "account_data_required",
@@ -276,7 +583,7 @@ def evaluate_pretrade_policy(
         )
 
     session = str(market.get("session") or "").lower()
-    session_ok = True
+    session_ok: bool = True
     if (
         asset_class_lc == "stock"
         and session
@@ -292,16 +599,16 @@ def evaluate_pretrade_policy(
         f"asset_class={asset_class_lc}, session={market.get('session')}, extended_hours={extended_hours}",
     )
 
-    sentiment_summary = None
-    sentiment_ok = True
-    if enable_sentiment_guardrail and side_lc == "buy" and asset_class_lc == "stock":
+    sentiment_summary: dict[str, Any] | None = None
+    sentiment_ok: bool = True
+    # The Reddit snapshot is the slowest input; in fail-fast mode only fetch
+    # it when every other gate has already passed.
+    if run_sentiment and not (fail_fast and blocked_by is not None):
         try:
-            snapshot = get_reddit_sentiment_snapshot(
-                symbols=symbol_up,
-                lookback_hours=24,
-                baseline_days=30,
-                limit_posts=120,
-            )
+            if sentiment_future is not None:
+                snapshot = _await_prefetch(sentiment_future, _SENTIMENT_TIMEOUT_SECONDS)
+            else:
+                snapshot = _cached_sentiment_snapshot(symbol_up)
             rows = snapshot.get("symbols") or []
             if rows:
                 row = rows[0]
@@ -333,7 +640,7 @@ def evaluate_pretrade_policy(
                 not sentiment_fail_closed,
                 f"fail_closed={int(sentiment_fail_closed)}, sentiment unavailable: {str(e)}",
             )
-    elif enable_sentiment_guardrail and side_lc == "buy":
+    elif enable_sentiment_guardrail and side_lc == "buy" and asset_class_lc != "stock":
         add_check("sentiment_guardrail", True, f"asset_class={asset_class_lc} (guardrail bypassed)")
 
     allowed = blocked_by is None
@@ -346,7 +653,10 @@ def evaluate_pretrade_policy(
         "allowed": allowed,
         "blocked_by": blocked_by,
         "reason": reason,
-        "checks": checks,
+        "checks": [
+            {"name": check.name, "status": "pass" if check.passed else "fail", "detail": check.detail}
+            for check in checks
+        ],
         "metrics": {
             "symbol": symbol_up,
             "asset_class": asset_class_lc,
@@ -378,6 +688,7 @@ def evaluate_pretrade_policy(
             "sentiment_fail_closed": sentiment_fail_closed,
             "sentiment_confidence_floor": sentiment_confidence_floor,
             "hard_exclude_enabled": enable_hard_exclude,
-            "hard_exclude_symbols": sorted(hard_exclude_symbols),
+            "hard_exclude_symbols": list(policy.hard_exclude_sorted),
         },
     }
+
@@ -1,15 +1,79 @@
 """Quantitative analysis helpers for MCP tools."""
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 import math
+import os
+import threading
+import time
+
+_HISTORY_TTL_SECONDS = max(0.0, float(os.getenv("ROBIN_YF_HISTORY_CACHE_TTL_SECONDS", "60")))
+_HISTORY_CACHE: dict[tuple[str, str], tuple[float, pd.DataFrame]] = {}
+_HISTORY_LOCK = threading.Lock()
+# yfinance downloads are network-bound; a small pool overlaps independent ones.
+_HISTORY_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="quant-history")
+
+
+def _daily_history(symbol: str, period: str) -> pd.DataFrame:
+    """
+    Daily yfinance history for symbol, reused across tools for a short TTL.
+
+    Technical indicators fetch SPY on every call and IV rank re-reads the same
+    symbol, so back-to-back tool calls share one download. Callers must treat
+    the returned frame as read-only.
+    """
+    key = (symbol.upper(), period)
+    now = time.monotonic()
+    with _HISTORY_LOCK:
+        item = _HISTORY_CACHE.get(key)
+        if item and now < item[0]:
+            return item[1]
+    hist = yf.Ticker(symbol).history(period=period)
+    if _HISTORY_TTL_SECONDS > 0 and hist is not None and not hist.empty:
+        with _HISTORY_LOCK:
+            _HISTORY_CACHE[key] = (time.monotonic() + _HISTORY_TTL_SECONDS, hist)
+    return hist
+
+
+def clear_history_cache() -> None:
+    """Drop all cached daily histories and sector/industry profiles."""
+    with _HISTORY_LOCK:
+        _HISTORY_CACHE.clear()
+        _PROFILE_CACHE.clear()
+
+
+# Sector/industry classification effectively never changes, so it is kept for
+# the life of the process instead of re-scraping Ticker.info on every call.
+_PROFILE_CACHE: dict[str, tuple[str | None, str | None]] = {}
+
+
+def _sector_industry(symbol: str) -> tuple[str | None, str | None]:
+    with _HISTORY_LOCK:
+        cached = _PROFILE_CACHE.get(symbol)
+    if cached:
+        return cached
+    info = yf.Ticker(symbol).info or {}
+    profile = (info.get("sector"), info.get("industry"))
+    if profile[0] or profile[1]:
+        with _HISTORY_LOCK:
+            _PROFILE_CACHE[symbol] = profile
+    return profile
+
+def _safe_round(value, digits=2):
+    """round(float(value), digits), or None for None/NaN (NaN != NaN skips pd.isna dispatch)."""
+    if value is None or value != value:
+        return None
+    return round(float(value), digits)
+
 
 def calculate_rsi(series, period=14):
     """Calculate Relative Strength Index (RSI) using Wilder's Smoothing."""
-    delta = series.diff()
-    gain = (delta.where(delta > 0, 0)).fillna(0)
-    loss = (-delta.where(delta < 0, 0)).fillna(0)
+    delta = series.diff().fillna(0)
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
 
     avg_gain = gain.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
     avg_loss = loss.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
@@ -20,11 +84,13 @@ def calculate_rsi(series, period=14):
 
 def calculate_atr(high, low, close, period=14):
     """Calculate Average True Range (ATR)."""
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    return tr.rolling(window=period).mean()
+    # Row-wise max of the three true-range legs without building a DataFrame;
+    # fmax skips NaN the way DataFrame.max(axis=1) does.
+    high_arr = high.to_numpy(dtype=float)
+    low_arr = low.to_numpy(dtype=float)
+    prev_close = close.shift().to_numpy(dtype=float)
+    tr = np.fmax(high_arr - low_arr, np.fmax(np.abs(high_arr - prev_close), np.abs(low_arr - prev_close)))
+    return pd.Series(tr, index=close.index).rolling(window=period).mean()
 
 def calculate_relative_strength(series, benchmark_series, period=252):
     """
@@ -37,31 +103,35 @@ def calculate_relative_strength(series, benchmark_series, period=252):
     if len(common_index) < period:
         return None
 
-    stock = pd.to_numeric(series.loc[common_index], errors="coerce")
-    bench = pd.to_numeric(benchmark_series.loc[common_index], errors="coerce")
+    stock = pd.to_numeric(series.loc[common_index], errors="coerce").to_numpy(dtype=float)
+    bench = pd.to_numeric(benchmark_series.loc[common_index], errors="coerce").to_numpy(dtype=float)
     valid = bench > 0
-    stock = stock[valid]
-    bench = bench[valid]
-    if len(stock) < period:
+    if np.count_nonzero(valid) < period:
         return None
 
-    rs_ratio = (stock / bench).replace([float("inf"), float("-inf")], pd.NA).dropna()
+    # Benchmark is positive, so only overflow or inf/inf can yield a non-finite ratio.
+    with np.errstate(over="ignore", invalid="ignore"):
+        rs_ratio = stock[valid] / bench[valid]
+    rs_ratio = rs_ratio[np.isfinite(rs_ratio)]
     if len(rs_ratio) < period:
         return None
     # Calculate percentile rank of current value within the lookback window
     # We want to know: is the RS ratio high relative to its recent history?
-    current_rs = rs_ratio.iloc[-1]
-    history_rs = rs_ratio.iloc[-period:]
-    percentile = (history_rs <= current_rs).mean() * 100
+    history_rs = rs_ratio[-period:]
+    current_rs = history_rs[-1]
+    percentile = np.count_nonzero(history_rs <= current_rs) / period * 100
     return percentile
 
+_SQRT_2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
 def _norm_cdf(x):
     """Cumulative distribution function for the standard normal distribution."""
-    return (1.0 + math.erf(x / math.sqrt(2.0))) / 2.0
+    return (1.0 + math.erf(x / _SQRT_2)) / 2.0
 
 def _norm_pdf(x):
     """Probability density function for the standard normal distribution."""
-    return math.exp(-0.5 * x ** 2) / math.sqrt(2.0 * math.pi)
+    return math.exp(-0.5 * x * x) / _SQRT_2PI
 
 def calculate_greeks(S, K, T, r, sigma, q=0.0, option_type="call"):
     """
@@ -80,31 +150,35 @@ def calculate_greeks(S, K, T, r, sigma, q=0.0, option_type="call"):
         return {k: None for k in ["delta", "gamma", "theta", "vega", "rho"]}
 
     try:
-        d1 = (math.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-        d2 = d1 - sigma * math.sqrt(T)
-
-        cdf_d1 = _norm_cdf(d1)
-        pdf_d1 = _norm_pdf(d1)
-        cdf_d2 = _norm_cdf(d2)
+        sqrt_t = math.sqrt(T)
+        disc_q = math.exp(-q * T)
+        disc_r = math.exp(-r * T)
+        d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)
+        d2 = d1 - sigma * sqrt_t
+
+        # _norm_cdf/_norm_pdf inlined: this runs once per contract in a chain scan.
+        cdf_d1 = (1.0 + math.erf(d1 / _SQRT_2)) / 2.0
+        pdf_d1 = math.exp(-0.5 * d1 * d1) / _SQRT_2PI
+        cdf_d2 = (1.0 + math.erf(d2 / _SQRT_2)) / 2.0
         
         # Common Gamma/Vega (same for calls and puts)
-        gamma = (pdf_d1 * math.exp(-q * T)) / (S * sigma * math.sqrt(T))
-        vega = S * math.exp(-q * T) * pdf_d1 * math.sqrt(T) / 100.0  # Scaled to 1% change
+        gamma = (pdf_d1 * disc_q) / (S * sigma * sqrt_t)
+        vega = S * disc_q * pdf_d1 * sqrt_t / 100.0  # Scaled to 1% change
 
         if option_type.lower() == "call":
-            delta = math.exp(-q * T) * cdf_d1
-            theta = ((-S * sigma * math.exp(-q * T) * pdf_d1) / (2 * math.sqrt(T)) 
-                     - r * K * math.exp(-r * T) * cdf_d2 
-                     + q * S * math.exp(-q * T) * cdf_d1) / 365.0
-            rho = (K * T * math.exp(-r * T) * cdf_d2) / 100.0
+            delta = disc_q * cdf_d1
+            theta = ((-S * sigma * disc_q * pdf_d1) / (2 * sqrt_t) 
+                     - r * K * disc_r * cdf_d2 
+                     + q * S * disc_q * cdf_d1) / 365.0
+            rho = (K * T * disc_r * cdf_d2) / 100.0
         else:
-            delta = math.exp(-q * T) * (cdf_d1 - 1)
-            cdf_neg_d2 = _norm_cdf(-d2)
-            cdf_neg_d1 = _norm_cdf(-d1)
-            theta = ((-S * sigma * math.exp(-q * T) * pdf_d1) / (2 * math.sqrt(T)) 
-                     + r * K * math.exp(-r * T) * cdf_neg_d2 
-                     - q * S * math.exp(-q * T) * cdf_neg_d1) / 365.0
-            rho = (-K * T * math.exp(-r * T) * cdf_neg_d2) / 100.0
+            delta = disc_q * (cdf_d1 - 1)
+            cdf_neg_d2 = (1.0 + math.erf(-d2 / _SQRT_2)) / 2.0
+            cdf_neg_d1 = (1.0 + math.erf(-d1 / _SQRT_2)) / 2.0
+            theta = ((-S * sigma * disc_q * pdf_d1) / (2 * sqrt_t) 
+                     + r * K * disc_r * cdf_neg_d2 
+                     - q * S * disc_q * cdf_neg_d1) / 365.0
+            rho = (-K * T * disc_r * cdf_neg_d2) / 100.0
 
         return {
             "delta": round(delta, 4),
@@ -156,8 +230,7 @@ def calculate_iv_rank(symbol: str, current_iv: float | None = None) -> dict | No
     proxy so callers do not mistake it for true IV rank.
     """
     try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period="1y")
+        hist = _daily_history(symbol, "1y")
         if len(hist) < 30:
             return None
 
@@ -354,21 +427,25 @@ def get_technical_indicators(symbol: str) -> dict:
     Returns a dictionary with calculated metrics.
     """
     try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period="2y")
-
-        spy_ticker = yf.Ticker("SPY")
-        spy_hist = spy_ticker.history(period="2y")
+        # Fetch the benchmark (and warm IV rank's 1y history) while the
+        # symbol's own history downloads.
+        spy_future = _HISTORY_EXECUTOR.submit(_daily_history, "SPY", "2y")
+        iv_history_future = (
+            _HISTORY_EXECUTOR.submit(_daily_history, symbol, "1y") if _HISTORY_TTL_SECONDS > 0 else None
+        )
+        hist = _daily_history(symbol, "2y")
+        spy_hist = spy_future.result()
         
         if len(hist) < 200:
              return {"error": f"Not enough history for {symbol} (found {len(hist)} days)"}
 
-        current_price = hist['Close'].iloc[-1]
+        close = hist['Close'].to_numpy(dtype=float)
+        current_price = close[-1]
         
-        # SMAs
-        sma_20 = hist['Close'].rolling(window=20).mean().iloc[-1]
-        sma_50 = hist['Close'].rolling(window=50).mean().iloc[-1]
-        sma_200 = hist['Close'].rolling(window=200).mean().iloc[-1]
+        # SMAs (only the latest value is needed, so average the trailing slice)
+        sma_20 = close[-20:].mean()
+        sma_50 = close[-50:].mean()
+        sma_200 = close[-200:].mean()
 
         # EMAs
         ema_9 = hist['Close'].ewm(span=9, adjust=False).mean().iloc[-1]
@@ -403,8 +480,8 @@ def get_technical_indicators(symbol: str) -> dict:
         rs_percentile = calculate_relative_strength(hist['Close'], spy_hist['Close'], period=252)
         
         # Returns
-        ret_5d = (hist['Close'].iloc[-1] / hist['Close'].iloc[-6] - 1) if len(hist) >= 6 else 0.0
-        ret_20d = (hist['Close'].iloc[-1] / hist['Close'].iloc[-21] - 1) if len(hist) >= 21 else 0.0
+        ret_5d = (close[-1] / close[-6] - 1) if len(close) >= 6 else 0.0
+        ret_20d = (close[-1] / close[-21] - 1) if len(close) >= 21 else 0.0
         
         # Relative Volume
         vol_20d_avg = hist['Volume'].iloc[-21:-1].mean()
@@ -417,6 +494,8 @@ def get_technical_indicators(symbol: str) -> dict:
         vwap_20d = cumulative_vwap.iloc[-1] if not pd.isna(cumulative_vwap.iloc[-1]) else None
 
         # IV Rank
+        if iv_history_future is not None:
+            wait([iv_history_future])
         iv_data = calculate_iv_rank(symbol)
 
         # ATR-based Sizing
@@ -446,24 +525,24 @@ def get_technical_indicators(symbol: str) -> dict:
             "symbol": symbol.upper(),
             "price": round(float(current_price), 2),
             "as_of_bar": hist.index[-1].isoformat() if len(hist.index) else None,
-            "sma_20": round(float(sma_20), 2) if not pd.isna(sma_20) else None,
-            "sma_50": round(float(sma_50), 2) if not pd.isna(sma_50) else None,
-            "sma_200": round(float(sma_200), 2) if not pd.isna(sma_200) else None,
-            "ema_9": round(float(ema_9), 2) if not pd.isna(ema_9) else None,
-            "ema_21": round(float(ema_21), 2) if not pd.isna(ema_21) else None,
-            "rsi_14": round(float(rsi_14), 2) if not pd.isna(rsi_14) else None,
-            "atr_14": round(float(atr_14), 2) if not pd.isna(atr_14) else None,
+            "sma_20": _safe_round(sma_20, 2),
+            "sma_50": _safe_round(sma_50, 2),
+            "sma_200": _safe_round(sma_200, 2),
+            "ema_9": _safe_round(ema_9, 2),
+            "ema_21": _safe_round(ema_21, 2),
+            "rsi_14": _safe_round(rsi_14, 2),
+            "atr_14": _safe_round(atr_14, 2),
             "macd": {
-                "value": round(float(macd_val), 4) if not pd.isna(macd_val) else None,
-                "signal": round(float(macd_signal), 4) if not pd.isna(macd_signal) else None,
-                "histogram": round(float(macd_hist), 4) if not pd.isna(macd_hist) else None,
+                "value": _safe_round(macd_val, 4),
+                "signal": _safe_round(macd_signal, 4),
+                "histogram": _safe_round(macd_hist, 4),
                 "crossover": macd_crossover,
             },
             "bollinger": {
-                "upper": round(float(bb_upper), 2) if not pd.isna(bb_upper) else None,
-                "lower": round(float(bb_lower), 2) if not pd.isna(bb_lower) else None,
-                "pct_b": round(float(bb_pct_b), 4) if not pd.isna(bb_pct_b) else None,
-                "bandwidth": round(float(bb_bandwidth), 4) if not pd.isna(bb_bandwidth) else None,
+                "upper": _safe_round(bb_upper, 2),
+                "lower": _safe_round(bb_lower, 2),
+                "pct_b": _safe_round(bb_pct_b, 4),
+                "bandwidth": _safe_round(bb_bandwidth, 4),
             },
             "vwap_20d": round(float(vwap_20d), 2) if vwap_20d is not None else None,
             "rs_spy_percentile": round(float(rs_percentile), 2) if rs_percentile is not None else None,
@@ -474,7 +553,7 @@ def get_technical_indicators(symbol: str) -> dict:
             "relative_volume_context": {
                 "method": "latest_daily_volume_vs_prior_20_full_day_average",
                 "current_volume": int(curr_vol) if not pd.isna(curr_vol) else None,
-                "prior_20d_avg_volume": round(float(vol_20d_avg), 2) if not pd.isna(vol_20d_avg) else None,
+                "prior_20d_avg_volume": _safe_round(vol_20d_avg, 2),
                 "valid_for": "daily_or_near_close",
                 "intraday_low_signal_reliable": False,
                 "decision_role": "soft_context_only_during_market_hours",
@@ -736,23 +815,22 @@ def get_sector_performance() -> list:
         # We want 'Close'
         
         close_data = data['Close'] if 'Close' in data else data
+        # If multi-index, symbols may sit in the second level; resolve that once.
+        second_level = (
+            set(close_data.columns.get_level_values(1))
+            if isinstance(close_data.columns, pd.MultiIndex)
+            else set()
+        )
         
         for symbol, name in sectors.items():
             try:
                 # Extract series for this symbol
-                if isinstance(close_data.columns, pd.MultiIndex):
-                     # If multi-index, check if symbol is in second level
-                     if symbol in close_data.columns.get_level_values(1):
-                         series = close_data.xs(symbol, axis=1, level=1)
-                     elif symbol in close_data.columns:
-                         series = close_data[symbol]
-                     else:
-                         continue
+                if symbol in second_level:
+                    series = close_data.xs(symbol, axis=1, level=1)
+                elif symbol in close_data.columns:
+                    series = close_data[symbol]
                 else:
-                     if symbol in close_data.columns:
-                         series = close_data[symbol]
-                     else:
-                         continue
+                    continue
 
                 series = series.dropna()
                 if len(series) >= 2:
@@ -783,7 +861,7 @@ def get_portfolio_correlation(symbols: list[str], period="1y") -> dict:
         return {"error": "Need at least 2 symbols for correlation."}
 
     # Clean symbols
-    raw_symbols = [str(s).upper().strip() for s in symbols if str(s).strip()]
+    raw_symbols = [sym for sym in (str(s).strip().upper() for s in symbols) if sym]
     clean_symbols = list(dict.fromkeys(s for s in raw_symbols if s.isalpha() and 1 <= len(s) <= 5))
     dropped_symbols = [s for s in raw_symbols if s not in clean_symbols]
     if len(clean_symbols) < 2:
@@ -802,33 +880,40 @@ def get_portfolio_correlation(symbols: list[str], period="1y") -> dict:
         effective_symbols = [str(c) for c in close_data.columns]
         dropped_symbols.extend([s for s in clean_symbols if s not in effective_symbols and s not in dropped_symbols])
 
-        corr_matrix = close_data.corr(min_periods=20)
+        # Correlate daily returns rather than price levels: two trending series
+        # look correlated on prices even when their day-to-day moves are not.
+        # DataFrame.corr keeps pairwise NaN handling for shorter histories.
+        returns = close_data.pct_change(fill_method=None)
+        corr_matrix = returns.corr(min_periods=20)
         
-        # Identify high correlation pairs (> 0.7)
-        high_corr_pairs = []
-        # Iterate over upper triangle
-        cols = corr_matrix.columns
-        for i in range(len(cols)):
-            for j in range(i + 1, len(cols)):
-                sym1 = cols[i]
-                sym2 = cols[j]
-                val = corr_matrix.iloc[i, j]
-                if pd.notna(val) and val > 0.7:
-                    high_corr_pairs.append({
-                        "pair": [str(sym1), str(sym2)],
-                        "correlation": round(float(val), 2)
-                    })
+        # Identify high correlation pairs (> 0.7) from the upper triangle;
+        # NaN never compares greater, so missing correlations drop out.
+        cols = [str(c) for c in corr_matrix.columns]
+        corr_values = corr_matrix.to_numpy()
+        rows_i, cols_j = np.triu_indices(len(cols), k=1)
+        upper = corr_values[rows_i, cols_j]
+        high_corr_pairs = [
+            {
+                "pair": [cols[rows_i[k]], cols[cols_j[k]]],
+                "correlation": round(float(upper[k]), 2)
+            }
+            for k in np.flatnonzero(upper > 0.7)
+        ]
         
         # Convert matrix to dict for JSON
-        # { "AAPL": { "MSFT": 0.8, ... }, ... }
-        corr_clean = corr_matrix.round(2).where(pd.notna(corr_matrix), None)
-        matrix_dict = corr_clean.to_dict()
+        # { "AAPL": { "MSFT": 0.8, ... }, ... }  (NaN -> None; NaN != NaN)
+        rounded = np.round(corr_values, 2).tolist()
+        matrix_dict = {
+            col: {row: (None if rounded[i][j] != rounded[i][j] else rounded[i][j]) for i, row in enumerate(cols)}
+            for j, col in enumerate(cols)
+        }
         
         return {
             "symbols": clean_symbols,
             "effective_symbols": effective_symbols,
             "dropped_symbols": dropped_symbols,
             "correlation_matrix": matrix_dict,
+            "basis": "daily_returns",
             "high_correlation_pairs": high_corr_pairs,
             "count": len(high_corr_pairs)
         }
@@ -844,10 +929,7 @@ def get_peers(symbol: str, limit: int = 6) -> dict:
     """
     symbol_up = str(symbol).upper().strip()
     try:
-        ticker = yf.Ticker(symbol_up)
-        info = ticker.info or {}
-        sector = info.get("sector")
-        industry = info.get("industry")
+        sector, industry = _sector_industry(symbol_up)
 
         if not sector and not industry:
             return {"error": f"Sector/Industry not found for {symbol_up}"}
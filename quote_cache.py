@@ -0,0 +1,85 @@
+"""Per-symbol TTL cache for Robinhood quote and fundamentals lookups.
+
+Back-to-back pre-trade checks and position listings tend to ask for the same
+symbols within seconds. ``get_quotes_cached`` / ``get_fundamentals_cached``
+serve fresh entries from memory and fetch every miss in one multi-symbol
+Robinhood call.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import robin_stocks.robinhood as rh
+
+_QUOTE_TTL_SECONDS = max(0.0, float(os.getenv("ROBIN_QUOTE_CACHE_TTL_SECONDS", "2")))
+_FUNDAMENTALS_TTL_SECONDS = max(0.0, float(os.getenv("ROBIN_FUNDAMENTALS_CACHE_TTL_SECONDS", "21600")))
+
+_QUOTE_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_FUNDAMENTALS_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_LOCK = threading.Lock()
+
+
+def _normalize_symbols(symbols: str | Iterable[str]) -> List[str]:
+    if isinstance(symbols, str):
+        symbols = symbols.split(",")
+    seen: Dict[str, None] = {}
+    for sym in symbols:
+        key = str(sym or "").strip().upper()
+        if key:
+            seen[key] = None
+    return list(seen)
+
+
+def _cached_batch(
+    symbols: str | Iterable[str],
+    cache: Dict[str, Tuple[float, Dict[str, Any]]],
+    ttl_seconds: float,
+    fetch: Callable[[List[str]], Any],
+) -> List[Dict[str, Any]]:
+    wanted = _normalize_symbols(symbols)
+    now = time.monotonic()
+    found: Dict[str, Dict[str, Any]] = {}
+    misses: List[str] = []
+    with _LOCK:
+        for sym in wanted:
+            item = cache.get(sym)
+            if item and now < item[0]:
+                found[sym] = item[1]
+            else:
+                misses.append(sym)
+
+    if misses:
+        rows = fetch(misses) or []
+        expires_at = time.monotonic() + ttl_seconds
+        with _LOCK:
+            for row in rows:
+                if not isinstance(row, dict):
+                    continue
+                sym = str(row.get("symbol") or "").upper()
+                if not sym:
+                    continue
+                found[sym] = row
+                if ttl_seconds > 0:
+                    cache[sym] = (expires_at, row)
+
+    return [found[sym] for sym in wanted if sym in found]
+
+
+def get_quotes_cached(symbols: str | Iterable[str]) -> List[Dict[str, Any]]:
+    """Return Robinhood quotes for ``symbols``, fetching only stale/missing ones."""
+    return _cached_batch(symbols, _QUOTE_CACHE, _QUOTE_TTL_SECONDS, rh.get_quotes)
+
+
+def get_fundamentals_cached(symbols: str | Iterable[str]) -> List[Dict[str, Any]]:
+    """Return Robinhood fundamentals for ``symbols``, fetching only stale/missing ones."""
+    return _cached_batch(symbols, _FUNDAMENTALS_CACHE, _FUNDAMENTALS_TTL_SECONDS, rh.get_fundamentals)
+
+
+def clear_quote_cache() -> None:
+    """Drop all cached quotes and fundamentals."""
+    with _LOCK:
+        _QUOTE_CACHE.clear()
+        _FUNDAMENTALS_CACHE.clear()
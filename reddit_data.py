@@ -3,9 +3,43 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from urllib3.util.retry import Retry  # type: ignore
+except Exception:
+    Retry = None  # type: ignore[assignment]
+
+
+def _build_session() -> requests.Session:
+    retry: Any = 0
+    if Retry is not None:
+        # Reddit's public JSON endpoints rate-limit with 429; back off and honor Retry-After.
+        retry = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+# Shared keep-alive pool so back-to-back public-API requests skip the TLS handshake.
+_SESSION = _build_session()
+
+
+def get_reddit_session() -> requests.Session:
+    """Return the shared pooled session used for public Reddit JSON requests."""
+    return _SESSION
 
 
 def _iso_utc(ts: float | int | None) -> str | None:
@@ -17,8 +51,17 @@ def _iso_utc(ts: float | int | None) -> str | None:
         return None
 
 
-def _parse_subreddits(subreddits: str) -> List[str]:
-    subs = [s.strip() for s in str(subreddits or "").split(",") if s.strip()]
+@lru_cache(maxsize=128)
+def split_subreddits(subreddits: str) -> Tuple[str, ...]:
+    """Split a comma-separated subreddit list once per unique string."""
+    return tuple(s.strip() for s in subreddits.split(",") if s.strip())
+
+
+def _parse_subreddits(subreddits: str | Sequence[str]) -> List[str]:
+    if isinstance(subreddits, (list, tuple)):
+        subs = [str(s).strip() for s in subreddits if str(s).strip()]
+    else:
+        subs = list(split_subreddits(str(subreddits or "")))
     return subs or ["wallstreetbets", "stocks", "investing", "SecurityAnalysis"]
 
 
@@ -121,8 +164,12 @@ def _comment_json_to_dict(data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _flatten_comment_children(children: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Explicit stack instead of recursion: deep reply chains cannot hit the
+    # recursion limit. Children are pushed reversed to keep depth-first order.
     out: List[Dict[str, Any]] = []
-    for child in children or []:
+    stack = list(reversed(children or []))
+    while stack:
+        child = stack.pop()
         if child.get("kind") != "t1":
             continue
         data = child.get("data", {}) or {}
@@ -130,16 +177,17 @@ def _flatten_comment_children(children: List[Dict[str, Any]]) -> List[Dict[str,
         replies = data.get("replies")
         if isinstance(replies, dict):
             nested = replies.get("data", {}).get("children", []) or []
-            out.extend(_flatten_comment_children(nested))
+            stack.extend(reversed(nested))
     return out
 
 
 def fetch_reddit_posts(
     query: str,
-    subreddits: str,
+    subreddits: str | Sequence[str],
     sort: str = "new",
     time_filter: str = "day",
     limit: int = 50,
+    session: requests.Session | None = None,
 ) -> Dict[str, Any]:
     subs = _parse_subreddits(subreddits)
     safe_limit = max(1, min(int(limit), 200))
@@ -173,7 +221,7 @@ def fetch_reddit_posts(
             "restrict_sr": "on",
             "limit": safe_limit,
         }
-        resp = requests.get(url, params=params, headers=_http_headers(), timeout=15)
+        resp = (session or _SESSION).get(url, params=params, headers=_http_headers(), timeout=15)
         resp.raise_for_status()
         data = resp.json()
         children = data.get("data", {}).get("children", []) or []
@@ -200,6 +248,7 @@ def fetch_reddit_post_comments(
     post_id: str,
     sort: str = "top",
     limit: int = 100,
+    session: requests.Session | None = None,
 ) -> Dict[str, Any]:
     safe_post_id = str(post_id or "").strip()
     if not safe_post_id:
@@ -224,7 +273,7 @@ def fetch_reddit_post_comments(
     else:
         url = f"https://www.reddit.com/comments/{safe_post_id}.json"
         params = {"sort": safe_sort, "limit": safe_limit}
-        resp = requests.get(url, params=params, headers=_http_headers(), timeout=15)
+        resp = (session or _SESSION).get(url, params=params, headers=_http_headers(), timeout=15)
         resp.raise_for_status()
         payload = resp.json()
         if not isinstance(payload, list) or len(payload) < 2:
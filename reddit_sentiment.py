@@ -4,8 +4,10 @@ from __future__ import annotations
 import math
 import os
 import re
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
 from typing import Any, Dict, List, Tuple
@@ -126,22 +128,88 @@ SUBREDDIT_QUALITY = {
 
 _STATS_CACHE: dict[tuple, tuple[float, tuple[dict, dict]]] = {}
 _BASELINE_Z_CACHE: dict[tuple, tuple[float, dict[str, float]]] = {}
+_FETCH_CACHE: dict[tuple, tuple[float, dict]] = {}
+_TRADABLE_CACHE: dict[str, bool] = {}
+
+_SYMBOL_TOKEN_RE = re.compile(r"[A-Z]{1,6}")
+_TICKER_TOKEN_RE = re.compile(r"[A-Z]{1,5}")
+_WORD_RE = re.compile(r"[A-Za-z']+")
+_UPPERCASE_RE = re.compile(r"[A-Z]")
+# Free-text ticker scans skip single letters ("I", "A") in the pattern itself.
+_TICKER_ANY_RE = re.compile(r"(?<![A-Z0-9])\$?([A-Z]{2,5})(?![A-Z0-9])")
+_TICKER_DOLLAR_RE = re.compile(r"(?<![A-Z0-9])\$([A-Z]{2,5})(?![A-Z0-9])")
+_TICKER_PLAIN_RE = re.compile(r"(?<![\$A-Z0-9])([A-Z]{2,5})(?![A-Z0-9])")
+_EXCLUDED_TICKER_TOKENS = frozenset(COMMON_UPPERCASE_WORDS | NON_TICKER_FINANCE_TERMS)
 _CACHE_TTL_SECONDS = max(60, int(os.getenv("REDDIT_SENTIMENT_CACHE_TTL_SECONDS", "300")))
+_CACHE_MAXSIZE = 512
+_CACHE_LOCK = threading.Lock()
+# Few workers on purpose: Reddit's public endpoints rate-limit aggressively.
+_COMMENT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="reddit-comments")
 
 
 def _cache_get(cache: dict, key: tuple):
-    item = cache.get(key)
-    if not item:
-        return None
-    expires_at, value = item
-    if time.time() >= expires_at:
-        cache.pop(key, None)
-        return None
-    return value
+    with _CACHE_LOCK:
+        item = cache.get(key)
+        if not item:
+            return None
+        expires_at, value = item
+        if time.time() >= expires_at:
+            cache.pop(key, None)
+            return None
+        return value
 
 
 def _cache_put(cache: dict, key: tuple, value):
-    cache[key] = (time.time() + _CACHE_TTL_SECONDS, value)
+    with _CACHE_LOCK:
+        if key not in cache and len(cache) >= _CACHE_MAXSIZE:
+            # Dicts preserve insertion order, so the first key is the oldest entry.
+            cache.pop(next(iter(cache)), None)
+        cache[key] = (time.time() + _CACHE_TTL_SECONDS, value)
+
+
+def _fetch_posts_cached(
+    query: str,
+    subreddits: str,
+    sort: str,
+    time_filter: str,
+    limit: int,
+    session: Any = None,
+) -> Dict[str, Any]:
+    # Snapshot, mentions and trending flows often repeat the same search within
+    # a few minutes; serve the raw payload from memory instead of re-querying.
+    key = ("posts", query, str(subreddits or "").lower(), sort, time_filter, int(limit))
+    cached = _cache_get(_FETCH_CACHE, key)
+    if cached is not None:
+        return cached
+    payload = fetch_reddit_posts(
+        query=query,
+        subreddits=subreddits,
+        sort=sort,
+        time_filter=time_filter,
+        limit=limit,
+        session=session,
+    )
+    _cache_put(_FETCH_CACHE, key, payload)
+    return payload
+
+
+def _fetch_comments_cached(post_id: str, sort: str, limit: int, session: Any = None) -> Dict[str, Any]:
+    key = ("comments", post_id, sort, int(limit))
+    cached = _cache_get(_FETCH_CACHE, key)
+    if cached is not None:
+        return cached
+    payload = fetch_reddit_post_comments(post_id=post_id, sort=sort, limit=limit, session=session)
+    _cache_put(_FETCH_CACHE, key, payload)
+    return payload
+
+
+def clear_sentiment_cache() -> None:
+    """Drop cached Reddit fetches, symbol stats, baseline z-scores and tradability checks."""
+    _TRADABLE_CACHE.clear()
+    _is_likely_tradable_symbol.cache_clear()
+    _FETCH_CACHE.clear()
+    _STATS_CACHE.clear()
+    _BASELINE_Z_CACHE.clear()
 
 
 def _build_mention_rows(stats: Dict[str, Dict[str, Any]], symbols: List[str]) -> List[Dict[str, Any]]:
@@ -169,7 +237,7 @@ def _parse_symbols(symbols: str) -> List[str]:
     parsed = []
     for token in str(symbols or "").split(","):
         sym = token.strip().upper().lstrip("$")
-        if sym and re.fullmatch(r"[A-Z]{1,6}", sym):
+        if sym and _SYMBOL_TOKEN_RE.fullmatch(sym):
             parsed.append(sym)
     return sorted(set(parsed))
 
@@ -199,8 +267,9 @@ def _snippet(text: str, max_len: int = 160) -> str:
     return clean[:max_len]
 
 
+@lru_cache(maxsize=4096)
 def _text_polarity(text: str) -> float:
-    words = re.findall(r"[A-Za-z']+", str(text or "").lower())
+    words = _WORD_RE.findall(str(text or "").lower())
     if not words:
         return 0.0
     bull = sum(1 for w in words if w in BULLISH_TERMS)
@@ -208,56 +277,89 @@ def _text_polarity(text: str) -> float:
     return (bull - bear) / float(bull + bear + 1)
 
 
+@lru_cache(maxsize=64)
+def _known_symbols_re(symbols: Tuple[str, ...]) -> re.Pattern:
+    # One alternation for the whole watchlist; longest first so "AAPL" is tried before "AA".
+    alternation = "|".join(re.escape(sym) for sym in sorted(symbols, key=len, reverse=True))
+    # Match "$AAPL" or standalone "AAPL"
+    return re.compile(rf"(?<![A-Z0-9])\$?({alternation})(?![A-Z0-9])", re.IGNORECASE)
+
+
 def _extract_known_symbol_mentions(text: str, symbols: List[str]) -> List[str]:
-    found = []
+    if not symbols:
+        return []
     source = str(text or "")
-    for sym in symbols:
-        # Match "$AAPL" or standalone "AAPL"
-        if re.search(rf"(?<![A-Z0-9])\$?{re.escape(sym)}(?![A-Z0-9])", source, flags=re.IGNORECASE):
-            found.append(sym)
-    return found
+    # Plain substring probes are much cheaper than the boundary-checked regex
+    # and rule out most texts; casefold mirrors the pattern's IGNORECASE.
+    folded = source.casefold()
+    if not any(sym.casefold() in folded for sym in symbols):
+        return []
+    hits = {raw.upper() for raw in _known_symbols_re(tuple(symbols)).findall(source)}
+    return [sym for sym in symbols if sym in hits]
 
 
 def _extract_any_ticker_tokens(text: str) -> List[str]:
     found = set()
-    for raw in re.findall(r"(?<![A-Z0-9])\$?([A-Z]{1,5})(?![A-Z0-9])", str(text or "")):
-        sym = raw.upper()
-        if sym in COMMON_UPPERCASE_WORDS:
-            continue
-        if sym in NON_TICKER_FINANCE_TERMS:
-            continue
-        if len(sym) == 1:
-            continue
-        found.add(sym)
+    for sym in _TICKER_ANY_RE.findall(str(text or "")):
+        if sym not in _EXCLUDED_TICKER_TOKENS:
+            found.add(sym)
     return sorted(found)
 
 
 def _extract_any_ticker_mentions(text: str) -> Dict[str, Dict[str, int]]:
     source = str(text or "")
     stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"plain": 0, "dollar": 0})
+    # Both ticker patterns need an uppercase run; all-lowercase chatter can skip them.
+    if not _UPPERCASE_RE.search(source):
+        return {}
 
-    for raw in re.findall(r"(?<![A-Z0-9])\$([A-Z]{1,5})(?![A-Z0-9])", source):
-        sym = raw.upper()
-        if sym in COMMON_UPPERCASE_WORDS or sym in NON_TICKER_FINANCE_TERMS or len(sym) == 1:
-            continue
-        stats[sym]["dollar"] += 1
+    # Most posts carry no "$" sigil at all; a substring check is far cheaper than the regex.
+    if "$" in source:
+        for sym in _TICKER_DOLLAR_RE.findall(source):
+            if sym not in _EXCLUDED_TICKER_TOKENS:
+                stats[sym]["dollar"] += 1
 
-    for raw in re.findall(r"(?<![\$A-Z0-9])([A-Z]{1,5})(?![A-Z0-9])", source):
-        sym = raw.upper()
-        if sym in COMMON_UPPERCASE_WORDS or sym in NON_TICKER_FINANCE_TERMS or len(sym) == 1:
-            continue
-        stats[sym]["plain"] += 1
+    for sym in _TICKER_PLAIN_RE.findall(source):
+        if sym not in _EXCLUDED_TICKER_TOKENS:
+            stats[sym]["plain"] += 1
 
     return dict(stats)
 
 
+def _prefetch_tradable_symbols(symbols: List[str]) -> None:
+    # One multi-ticker download resolves every trending candidate at once
+    # instead of a fast_info round trip per symbol.
+    pending = [
+        sym for sym in dict.fromkeys(symbols)
+        if sym not in _TRADABLE_CACHE and _TICKER_TOKEN_RE.fullmatch(sym) and sym not in _EXCLUDED_TICKER_TOKENS
+    ]
+    if not pending:
+        return
+    try:
+        import yfinance as yf
+        data = yf.download(pending, period="5d", progress=False, auto_adjust=False, threads=True)
+    except Exception:
+        return
+    if data is None or data.empty:
+        # Nothing came back (network trouble?): leave these to the per-symbol check.
+        return
+    close = data["Close"] if "Close" in data else data
+    if not hasattr(close, "columns"):
+        close = close.to_frame(pending[0])
+    for sym in pending:
+        _TRADABLE_CACHE[sym] = bool(sym in close.columns and close[sym].notna().any())
+
+
 @lru_cache(maxsize=1024)
 def _is_likely_tradable_symbol(symbol: str) -> bool:
     sym = str(symbol or "").upper().strip()
-    if not re.fullmatch(r"[A-Z]{1,5}", sym):
+    if not _TICKER_TOKEN_RE.fullmatch(sym):
         return False
-    if sym in COMMON_UPPERCASE_WORDS or sym in NON_TICKER_FINANCE_TERMS:
+    if sym in _EXCLUDED_TICKER_TOKENS:
         return False
+    known = _TRADABLE_CACHE.get(sym)
+    if known is not None:
+        return known
     try:
         import yfinance as yf
         info = yf.Ticker(sym).fast_info
@@ -308,12 +410,21 @@ def _temporal_decay(hours_old: float, half_life_hours: float = 12.0) -> float:
         return 0.0
 
 
+def _polarity_hit_key(polarity: float) -> str | None:
+    if polarity > 0:
+        return "bullish_hits"
+    if polarity < 0:
+        return "bearish_hits"
+    return None
+
+
 def _collect_symbol_stats(
     symbols: List[str],
     subreddits: str,
     lookback_hours: int,
     include_comments: bool,
     limit_posts: int,
+    session: Any = None,
 ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
     symbols_key = tuple(sorted(set(str(s).upper() for s in symbols)))
     cache_key = (
@@ -337,38 +448,70 @@ def _collect_symbol_stats(
     start = now - timedelta(hours=max(1, int(lookback_hours)))
     query = _make_symbol_query(symbols)
     time_filter = _lookback_to_time_filter(lookback_hours)
-    posts_payload = fetch_reddit_posts(
+    posts_payload = _fetch_posts_cached(
         query=query,
         subreddits=subreddits,
         sort="new",
         time_filter=time_filter,
         limit=max(1, min(int(limit_posts), 200)),
+        session=session,
     )
 
     stats: Dict[str, Dict[str, Any]] = {sym: _new_symbol_stats() for sym in symbols}
     posts_scanned = 0
     comments_scanned = 0
 
+    # Window checks compare raw epoch seconds; datetimes are only built for
+    # posts that actually mention a symbol.
+    start_ts = start.timestamp()
+    now_ts = now.timestamp()
+    mentioned_posts = []
     for post in posts_payload.get("posts", []):
         created = post.get("created_utc")
         if created is None:
             continue
-        post_dt = datetime.fromtimestamp(float(created), tz=timezone.utc)
-        if post_dt < start or post_dt > now:
+        created_ts = float(created)
+        if created_ts < start_ts or created_ts > now_ts:
             continue
 
         posts_scanned += 1
         post_text = f"{post.get('title', '')}\n{post.get('selftext', '')}"
         post_mentions = _extract_known_symbol_mentions(post_text, symbols)
+        if post_mentions:
+            post_dt = datetime.fromtimestamp(created_ts, tz=timezone.utc)
+            mentioned_posts.append((post, post_dt, post_text, post_mentions))
+
+    # Comment pages are I/O bound; start them all up front on the bounded pool
+    # and aggregate each one on this thread in post order.
+    comment_futures = []
+    if include_comments:
+        comment_futures = [
+            _COMMENT_EXECUTOR.submit(
+                _fetch_comments_cached,
+                post_id=str(post.get("id")),
+                sort="top",
+                limit=40,
+                session=session,
+            )
+            for post, _, _, _ in mentioned_posts
+        ]
+
+    for index, (post, post_dt, post_text, post_mentions) in enumerate(mentioned_posts):
         score = int(post.get("score", 0) or 0)
         num_comments = int(post.get("num_comments", 0) or 0)
         author = str(post.get("author", "") or "")
         subreddit = str(post.get("subreddit", "") or "").lower()
         post_polarity = _text_polarity(post_text)
         post_weight = math.log1p(max(0, score) + max(0, num_comments))
+        post_snippet = _snippet(post_text)
 
         hours_old_post = max(0.0, (now - post_dt).total_seconds() / 3600)
         decay_post = _temporal_decay(hours_old_post)
+        # Combine engagement weight with temporal decay; the contribution is
+        # the same for every symbol the post mentions.
+        effective_weight = post_weight * decay_post
+        weighted_polarity = post_polarity * effective_weight
+        post_hit_key = _polarity_hit_key(post_polarity)
         for sym in post_mentions:
             sym_stats = stats[sym]
             sym_stats["mention_count_total"] += 1
@@ -379,32 +522,22 @@ def _collect_symbol_stats(
             sym_stats["post_score_sum"] += score
             sym_stats["post_score_n"] += 1
             if len(sym_stats["sample_context"]) < 3:
-                sym_stats["sample_context"].append(_snippet(post_text))
-            # Combine engagement weight with temporal decay
-            effective_weight = post_weight * decay_post
-            sym_stats["weighted_polarity_sum"] += post_polarity * effective_weight
+                sym_stats["sample_context"].append(post_snippet)
+            sym_stats["weighted_polarity_sum"] += weighted_polarity
             sym_stats["polarity_weight_sum"] += effective_weight
             sym_stats["decay_weighted_mentions"] += decay_post
-            sym_stats["first_mention_ts"] = (
-                post_dt if sym_stats["first_mention_ts"] is None or post_dt < sym_stats["first_mention_ts"]
-                else sym_stats["first_mention_ts"]
-            )
-            sym_stats["last_mention_ts"] = (
-                post_dt if sym_stats["last_mention_ts"] is None or post_dt > sym_stats["last_mention_ts"]
-                else sym_stats["last_mention_ts"]
-            )
-            if post_polarity > 0:
-                sym_stats["bullish_hits"] += 1
-            elif post_polarity < 0:
-                sym_stats["bearish_hits"] += 1
+            first_ts = sym_stats["first_mention_ts"]
+            if first_ts is None or post_dt < first_ts:
+                sym_stats["first_mention_ts"] = post_dt
+            last_ts = sym_stats["last_mention_ts"]
+            if last_ts is None or post_dt > last_ts:
+                sym_stats["last_mention_ts"] = post_dt
+            if post_hit_key:
+                sym_stats[post_hit_key] += 1
             sym_stats["subreddit_mentions"][subreddit] += 1
 
-        if include_comments and post_mentions:
-            comments_payload = fetch_reddit_post_comments(
-                post_id=str(post.get("id")),
-                sort="top",
-                limit=40,
-            )
+        if include_comments:
+            comments_payload = comment_futures[index].result()
             for c in comments_payload.get("comments", []):
                 comments_scanned += 1
                 body = c.get("body", "") or ""
@@ -415,6 +548,9 @@ def _collect_symbol_stats(
                 c_author = str(c.get("author", "") or "")
                 c_polarity = _text_polarity(body)
                 c_weight = math.log1p(max(0, c_score))
+                c_snippet = _snippet(body)
+                c_weighted_polarity = c_polarity * c_weight
+                c_hit_key = _polarity_hit_key(c_polarity)
 
                 for sym in comment_mentions:
                     sym_stats = stats[sym]
@@ -425,13 +561,11 @@ def _collect_symbol_stats(
                     sym_stats["comment_score_sum"] += c_score
                     sym_stats["comment_score_n"] += 1
                     if len(sym_stats["sample_context"]) < 3:
-                        sym_stats["sample_context"].append(_snippet(body))
-                    sym_stats["weighted_polarity_sum"] += c_polarity * c_weight
+                        sym_stats["sample_context"].append(c_snippet)
+                    sym_stats["weighted_polarity_sum"] += c_weighted_polarity
                     sym_stats["polarity_weight_sum"] += c_weight
-                    if c_polarity > 0:
-                        sym_stats["bullish_hits"] += 1
-                    elif c_polarity < 0:
-                        sym_stats["bearish_hits"] += 1
+                    if c_hit_key:
+                        sym_stats[c_hit_key] += 1
                     sym_stats["subreddit_mentions"][subreddit] += 1
 
     data_quality = {
@@ -456,6 +590,7 @@ def get_reddit_symbol_mentions(
     lookback_hours: int = 24,
     include_comments: bool = True,
     limit_posts: int = 100,
+    session: Any = None,
 ) -> Dict[str, Any]:
     parsed = _parse_symbols(symbols)
     if not parsed:
@@ -469,6 +604,7 @@ def get_reddit_symbol_mentions(
         lookback_hours=lookback_hours,
         include_comments=include_comments,
         limit_posts=limit_posts,
+        session=session,
     )
 
     rows = _build_mention_rows(stats, parsed)
@@ -504,6 +640,7 @@ def _baseline_mentions_poisson_z_batch(
     subreddits: str,
     baseline_days: int,
     limit_posts: int,
+    session: Any = None,
 ) -> Dict[str, float]:
     symbols_key = tuple(sorted(set(str(s).upper() for s in symbols)))
     cache_key = (
@@ -520,15 +657,18 @@ def _baseline_mentions_poisson_z_batch(
     now = datetime.now(timezone.utc)
     baseline_start = now - timedelta(days=max(1, int(baseline_days)))
     current_window_start = now - timedelta(hours=max(1, int(lookback_hours)))
+    baseline_start_ts = baseline_start.timestamp()
+    current_window_start_ts = current_window_start.timestamp()
     tf = "month" if baseline_days <= 31 else "year"
     query = _make_symbol_query(list(symbols_key))
 
-    payload = fetch_reddit_posts(
+    payload = _fetch_posts_cached(
         query=query,
         subreddits=subreddits,
         sort="new",
         time_filter=tf,
         limit=max(50, min(limit_posts * 3, 400)),
+        session=session,
     )
 
     baseline_mentions: Dict[str, int] = {sym: 0 for sym in symbols_key}
@@ -536,8 +676,7 @@ def _baseline_mentions_poisson_z_batch(
         created = post.get("created_utc")
         if created is None:
             continue
-        dt = datetime.fromtimestamp(float(created), tz=timezone.utc)
-        if not (baseline_start <= dt < current_window_start):
+        if not (baseline_start_ts <= float(created) < current_window_start_ts):
             continue
         text = f"{post.get('title', '')}\n{post.get('selftext', '')}"
         for symbol in _extract_known_symbol_mentions(text, list(symbols_key)):
@@ -561,6 +700,7 @@ def get_reddit_sentiment_snapshot(
     lookback_hours: int = 24,
     baseline_days: int = 30,
     limit_posts: int = 200,
+    session: Any = None,
 ) -> Dict[str, Any]:
     parsed = _parse_symbols(symbols)
     if not parsed:
@@ -572,6 +712,7 @@ def get_reddit_sentiment_snapshot(
         lookback_hours=lookback_hours,
         include_comments=True,
         limit_posts=limit_posts,
+        session=session,
     )
     now = datetime.now(timezone.utc)
     start = now - timedelta(hours=max(1, int(lookback_hours)))
@@ -589,6 +730,7 @@ def get_reddit_sentiment_snapshot(
         subreddits=subreddits,
         baseline_days=baseline_days,
         limit_posts=limit_posts,
+        session=session,
     )
 
     out = []
@@ -702,15 +844,17 @@ def get_reddit_trending_tickers(
     lookback_hours: int = 24,
     min_mentions: int = 15,
     limit: int = 20,
+    session: Any = None,
 ) -> Dict[str, Any]:
     now = datetime.now(timezone.utc)
     start = now - timedelta(hours=max(1, int(lookback_hours)))
-    payload = fetch_reddit_posts(
+    payload = _fetch_posts_cached(
         query="stock OR earnings OR calls OR puts OR guidance",
         subreddits=subreddits,
         sort="new",
         time_filter=_lookback_to_time_filter(lookback_hours),
         limit=200,
+        session=session,
     )
 
     mention_counts = defaultdict(int)
@@ -719,13 +863,15 @@ def get_reddit_trending_tickers(
     polarity_sums = defaultdict(float)
     polarity_n = defaultdict(int)
 
+    start_ts = start.timestamp()
+    now_ts = now.timestamp()
     posts_considered = 0
     for post in payload.get("posts", []):
         created = post.get("created_utc")
         if created is None:
             continue
-        dt = datetime.fromtimestamp(float(created), tz=timezone.utc)
-        if dt < start or dt > now:
+        created_ts = float(created)
+        if created_ts < start_ts or created_ts > now_ts:
             continue
 
         posts_considered += 1
@@ -746,7 +892,7 @@ def get_reddit_trending_tickers(
             polarity_sums[sym] += pol
             polarity_n[sym] += 1
 
-    rows = []
+    candidates = []
     safe_min_mentions = max(1, int(min_mentions))
     for sym, count in mention_counts.items():
         if count < safe_min_mentions:
@@ -755,6 +901,11 @@ def get_reddit_trending_tickers(
         # Keep plain-uppercase detections only if there is breadth; otherwise require $TICKER usage.
         if mention_dollar_counts[sym] == 0 and authors_n < 2:
             continue
+        candidates.append((sym, count, authors_n))
+
+    _prefetch_tradable_symbols([sym for sym, _, _ in candidates])
+    rows = []
+    for sym, count, authors_n in candidates:
         if not _is_likely_tradable_symbol(sym):
             continue
         pol = polarity_sums[sym] / max(1, polarity_n[sym])
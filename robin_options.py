@@ -1,14 +1,61 @@
 """Robinhood Options helpers."""
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+import os
+import threading
+import time
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import robin_stocks.robinhood as rh
 
+import net_session  # noqa: F401  (pools robin_stocks connections)
+from quote_cache import get_quotes_cached
+
+# IV lookups and chain listings for the same symbol/expiration usually arrive
+# together; share the chain and per-expiration option lists for a short TTL.
+_OPTIONS_TTL_SECONDS = max(0.0, float(os.getenv("ROBIN_OPTIONS_CACHE_TTL_SECONDS", "15")))
+_OPTIONS_CACHE: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+_LOCK = threading.Lock()
+
+
+def _cached(key: Tuple[str, ...], fetch: Callable[[], Any]) -> Any:
+    now = time.monotonic()
+    with _LOCK:
+        item = _OPTIONS_CACHE.get(key)
+        if item and now < item[0]:
+            return item[1]
+    value = fetch()
+    # Empty responses are usually transient or auth failures; do not pin them.
+    if value and _OPTIONS_TTL_SECONDS > 0:
+        with _LOCK:
+            _OPTIONS_CACHE[key] = (time.monotonic() + _OPTIONS_TTL_SECONDS, value)
+    return value
+
+
+def _get_chains(symbol: str) -> Any:
+    symbol = symbol.upper()
+    return _cached(("chains", symbol), lambda: rh.get_chains(symbol))
+
+
+def _find_options(symbol: str, expiration_date: str) -> Any:
+    symbol = symbol.upper()
+    return _cached(
+        ("options", symbol, expiration_date),
+        lambda: rh.find_options_by_expiration(symbol, expiration_date),
+    )
+
+
+def clear_options_cache() -> None:
+    """Drop cached option chains and per-expiration option lists."""
+    with _LOCK:
+        _OPTIONS_CACHE.clear()
+
+
 def get_implied_volatility(symbol: str) -> float | None:
     """Fetch current implied volatility for a symbol."""
     try:
         # We can get IV from the chain or options market data
         # Getting it from the nearest expiration's ATM option is a common proxy
-        chains = rh.get_chains(symbol)
+        chains = _get_chains(symbol)
         if not chains or 'expiration_dates' not in chains:
             return None
             
@@ -16,7 +63,7 @@ def get_implied_volatility(symbol: str) -> float | None:
         nearest_date = chains['expiration_dates'][0]
         
         # Get options for that date
-        options = rh.find_options_by_expiration(symbol, nearest_date)
+        options = _find_options(symbol, nearest_date)
         if not options:
             return None
             
@@ -32,7 +79,7 @@ def get_implied_volatility(symbol: str) -> float | None:
         # Better: let's just return the IV of the first option for now, or None if too complex to calculate accurately here without quote
         
         # Actually, let's fetch quote to find ATM
-        quote = rh.get_quotes(symbol)[0]
+        quote = get_quotes_cached(symbol)[0]
         price = float(quote['last_trade_price'])
         
         # Find ATM call
@@ -45,7 +92,7 @@ def get_implied_volatility(symbol: str) -> float | None:
 def get_option_expirations(symbol: str) -> List[str]:
     """Return available Robinhood option expiration dates for a symbol."""
     symbol = symbol.upper()
-    expirations_data = rh.get_chains(symbol)
+    expirations_data = _get_chains(symbol)
     if not expirations_data or 'expiration_dates' not in expirations_data:
         return []
     return list(expirations_data.get('expiration_dates') or [])
@@ -76,14 +123,14 @@ def get_option_chain(symbol: str, expiration_date: Optional[str] = None) -> Dict
 
     # 2. Get stock price for "near money" calculation
     try:
-        quote = rh.get_quotes(symbol)[0]
+        quote = get_quotes_cached(symbol)[0]
         current_price = float(quote['last_trade_price'])
     except Exception:
         current_price = 0.0
 
     # 3. Fetch options for the specific date
     # find_options_by_expiration returns a list of dicts with Greeks included
-    options = rh.find_options_by_expiration(symbol, expiration_date)
+    options = _find_options(symbol, expiration_date)
     
     calls = []
     puts = []
@@ -92,6 +139,13 @@ def get_option_chain(symbol: str, expiration_date: Optional[str] = None) -> Dict
         # Filter out invalid or inactive options if necessary
         if opt.get('state') != 'active':
             continue
+        opt_type = opt.get("type")
+        if opt_type == "call":
+            bucket = calls
+        elif opt_type == "put":
+            bucket = puts
+        else:
+            continue
             
         # Extract relevant data (use `or 0` to guard against explicit None values)
         item = {
@@ -107,17 +161,14 @@ def get_option_chain(symbol: str, expiration_date: Optional[str] = None) -> Dict
             "theta": float(opt.get("theta") or 0),
             "vega": float(opt.get("vega") or 0),
             "rho": float(opt.get("rho") or 0),
-            "type": opt.get("type")
+            "type": opt_type
         }
-        
-        if opt["type"] == "call":
-            calls.append(item)
-        elif opt["type"] == "put":
-            puts.append(item)
+        bucket.append(item)
             
     # Sort by strike price
-    calls.sort(key=lambda x: x["strike"])
-    puts.sort(key=lambda x: x["strike"])
+    by_strike = itemgetter("strike")
+    calls.sort(key=by_strike)
+    puts.sort(key=by_strike)
     
     return {
         "symbol": symbol,
@@ -1,27 +1,86 @@
 """Market sentiment helpers (Fear & Greed, VIX, yield curve, breadth)."""
+import os
+import threading
+import time
 import requests
 import yfinance as yf
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, Any, Optional, Tuple
+
+try:
+    from urllib3.util.retry import Retry  # type: ignore
+except Exception:
+    Retry = None  # type: ignore[assignment]
+
+_FEAR_GREED_URL = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
+_FEAR_GREED_HEADERS = {
+    'authority': 'production.dataviz.cnn.io',
+    'accept': '*/*',
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36',
+    'origin': 'https://edition.cnn.com',
+    'referer': 'https://edition.cnn.com/',
+    'sec-fetch-site': 'cross-site',
+    'sec-fetch-mode': 'cors',
+    'sec-fetch-dest': 'empty',
+}
+
+
+def _build_session() -> requests.Session:
+    retry: Any = 0
+    if Retry is not None:
+        retry = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return s
+
+
+# Keep-alive pool so repeated Fear & Greed lookups skip the TLS handshake.
+_SESSION = _build_session()
+
+# Fear & Greed only updates a few times an hour; VIX moves with the market.
+_FEAR_GREED_TTL_SECONDS = max(0.0, float(os.getenv("ROBIN_FEAR_GREED_CACHE_TTL_SECONDS", "300")))
+_VIX_TTL_SECONDS = max(0.0, float(os.getenv("ROBIN_VIX_CACHE_TTL_SECONDS", "60")))
+_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cached(key: str, ttl_seconds: float, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        item = _CACHE.get(key)
+        if item and now < item[0]:
+            return dict(item[1])
+    value = fetch()
+    # Errors are not cached so the next call retries immediately.
+    if ttl_seconds > 0 and not value.get("error"):
+        with _CACHE_LOCK:
+            _CACHE[key] = (time.monotonic() + ttl_seconds, value)
+    return dict(value)
+
+
+def clear_sentiment_cache() -> None:
+    """Drop cached Fear & Greed and VIX readings."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
 
 def get_fear_and_greed() -> Dict[str, Any]:
     """
     Fetch CNN Fear & Greed Index.
     Returns dictionary with score, rating, and timestamp.
     """
-    url = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
-    headers = {
-        'authority': 'production.dataviz.cnn.io',
-        'accept': '*/*',
-        'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36',
-        'origin': 'https://edition.cnn.com',
-        'referer': 'https://edition.cnn.com/',
-        'sec-fetch-site': 'cross-site',
-        'sec-fetch-mode': 'cors',
-        'sec-fetch-dest': 'empty',
-    }
-    
+    return _cached("fear_and_greed", _FEAR_GREED_TTL_SECONDS, _fetch_fear_and_greed)
+
+
+def _fetch_fear_and_greed() -> Dict[str, Any]:
     try:
-        r = requests.get(url, headers=headers, timeout=10)
+        r = _SESSION.get(_FEAR_GREED_URL, headers=_FEAR_GREED_HEADERS, timeout=10)
         if r.status_code == 200:
             data = r.json()
             fg_data = data.get('fear_and_greed', {})
@@ -36,16 +95,27 @@ def get_fear_and_greed() -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
+def _optional_float(value: Any) -> Optional[float]:
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if result != result else result
+
+
 def get_vix() -> Dict[str, Any]:
     """
     Fetch VIX (Volatility Index) from Yahoo Finance.
     """
+    return _cached("vix", _VIX_TTL_SECONDS, _fetch_vix)
+
+
+def _fetch_vix() -> Dict[str, Any]:
     try:
-        ticker = yf.Ticker("^VIX")
-        info = ticker.info
-        # Yahoo finance keys vary; try reliable ones for indices
-        price = info.get("regularMarketPrice") or info.get("currentPrice") or info.get("last_price")
-        prev = info.get("previousClose") or info.get("regularMarketPreviousClose")
+        # fast_info reads the chart endpoint only, instead of the full quote-summary scrape behind .info
+        fi = yf.Ticker("^VIX").fast_info
+        price = _optional_float(fi.last_price)
+        prev = _optional_float(fi.previous_close)
         
         # Calculate change if possible
         change = 0.0
@@ -59,10 +129,10 @@ def get_vix() -> Dict[str, Any]:
             "previous_close": prev,
             "change": change,
             "percent_change": pct_change,
-            "day_high": info.get("dayHigh"),
-            "day_low": info.get("dayLow"),
-            "52_week_high": info.get("fiftyTwoWeekHigh"),
-            "52_week_low": info.get("fiftyTwoWeekLow")
+            "day_high": _optional_float(fi.day_high),
+            "day_low": _optional_float(fi.day_low),
+            "52_week_high": _optional_float(fi.year_high),
+            "52_week_low": _optional_float(fi.year_low)
         }
     except Exception as e:
         return {"error": str(e)}
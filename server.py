@@ -1,5 +1,6 @@
 """MCP Server for Robinhood Skills."""
 import argparse
+import heapq
 import json
 import os
 import tempfile
@@ -391,6 +392,20 @@ def cancel_order(order_id: str) -> dict:
             "result_text": f"Error cancelling order: {str(e)}",
         }
 
+def _format_position_line(pos: dict) -> str:
+    """Render one build_holdings position as a single result_text line."""
+    return (
+        f"{pos['symbol']}: {pos['quantity']} shares @ ${pos['average_buy_price']:.2f} | "
+        f"Equity: ${pos['equity']:.2f} | "
+        f"Day P/L: {pos['intraday_profit_loss']:+.2f} ({pos['intraday_percent_change']:+.2f}%) | "
+        f"Total P/L: {pos['equity_change']:+.2f} ({pos['percent_change']:+.2f}%) | "
+        f"P/E: {pos.get('pe_ratio', 'N/A')} | "
+        f"Mkt Cap: {pos.get('market_cap', 'N/A')} | "
+        f"52W High: {pos.get('high_52_weeks', 'N/A')} | "
+        f"52W Low: {pos.get('low_52_weeks', 'N/A')}"
+    )
+
+
 @mcp.tool()
 def get_portfolio() -> dict:
     """Get the current user's open stock positions with detailed P/L.
@@ -407,24 +422,7 @@ def get_portfolio() -> dict:
                 "result_text": "No open positions found.",
             }
 
-        lines = []
-        normalized = []
-        for pos in positions:
-            day_pl = f"{pos['intraday_profit_loss']:+.2f} ({pos['intraday_percent_change']:+.2f}%)"
-            total_pl = f"{pos['equity_change']:+.2f} ({pos['percent_change']:+.2f}%)"
-            line = (
-                f"{pos['symbol']}: {pos['quantity']} shares @ ${pos['average_buy_price']:.2f} | "
-                f"Equity: ${pos['equity']:.2f} | "
-                f"Day P/L: {day_pl} | "
-                f"Total P/L: {total_pl} | "
-                f"P/E: {pos.get('pe_ratio', 'N/A')} | "
-                f"Mkt Cap: {pos.get('market_cap', 'N/A')} | "
-                f"52W High: {pos.get('high_52_weeks', 'N/A')} | "
-                f"52W Low: {pos.get('low_52_weeks', 'N/A')}"
-            )
-            lines.append(line)
-            normalized.append(pos)
-
+        normalized = list(positions)
         return {
             "positions": normalized,
             "count": len(normalized),
@@ -433,7 +431,7 @@ def get_portfolio() -> dict:
                 "generated_at_utc": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
                 "warnings": ["Fundamental enrichment may be incomplete when Robinhood omits sector or industry fields."],
             },
-            "result_text": "\n".join(lines),
+            "result_text": "\n".join(map(_format_position_line, normalized)),
         }
     except Exception as e:
         return {
@@ -491,6 +489,14 @@ def _validate_symbol(symbol: str) -> str | None:
     return None
 
 
+def _history_csv_row(point: dict) -> str:
+    """Render one historicals bar as a Date,Open,High,Low,Close,Volume CSV row."""
+    return (
+        f"{point.get('begins_at')},{point.get('open_price')},{point.get('high_price')},"
+        f"{point.get('low_price')},{point.get('close_price')},{point.get('volume', 0)}"
+    )
+
+
 @mcp.tool()
 def get_stock_history(symbol: str, span: str = "week", interval: str = "day") -> dict:
     """Get historical OHLCV price data for a stock.
@@ -528,24 +534,20 @@ def get_stock_history(symbol: str, span: str = "week", interval: str = "day") ->
                 "result_text": f"No history found for {sym}.",
             }
 
-        lines = ["Date,Open,High,Low,Close,Volume"]
-        for point in data:
-            lines.append(
-                f"{point.get('begins_at')},{point.get('open_price')},{point.get('high_price')},{point.get('low_price')},{point.get('close_price')},{point.get('volume', 0)}"
-            )
+        csv_text = "\n".join(("Date,Open,High,Low,Close,Volume", *map(_history_csv_row, data)))
 
         return {
             "symbol": sym,
             "span": span,
             "interval": interval,
             "candles": data,
-            "csv": "\n".join(lines),
+            "csv": csv_text,
             "data_quality": {
                 "source": "robinhood_stock_historicals",
                 "fetched_at_utc": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
                 "last_bar": data[-1].get("begins_at") if data else None,
             },
-            "result_text": "\n".join(lines),
+            "result_text": csv_text,
         }
     except Exception as e:
         return {
@@ -740,8 +742,8 @@ def get_option_chain(symbol: str, expiration_date: str, strikes: int = 5) -> dic
         warning = None
         if current_price <= 0:
             warning = "current_price is unavailable; strike filtering skipped and response capped by open_interest."
-            selected_calls = sorted(calls, key=lambda c: to_int(c.get("open_interest"), 0), reverse=True)[: max(1, int(strikes))]
-            selected_puts = sorted(puts, key=lambda p: to_int(p.get("open_interest"), 0), reverse=True)[: max(1, int(strikes))]
+            selected_calls = heapq.nlargest(max(1, int(strikes)), calls, key=lambda c: to_int(c.get("open_interest"), 0))
+            selected_puts = heapq.nlargest(max(1, int(strikes)), puts, key=lambda p: to_int(p.get("open_interest"), 0))
         else:
             selected_calls = select_nearby_strikes(calls, current_price, strikes)
             selected_puts = select_nearby_strikes(puts, current_price, strikes)
@@ -1013,31 +1015,26 @@ def get_yf_option_chain(symbol: str, expiration_date: str, strikes: int = 5) ->
                 "type": opt.get("contractSymbol", ""),
             }
 
+        def _by_open_interest(opt: dict) -> tuple:
+            return (-to_int(opt.get("openInterest"), 0), to_float(opt.get("strike"), 0.0))
+
+        # Select on the raw Yahoo rows first so Greeks are only estimated for
+        # the contracts that are actually returned.
         if current_price <= 0:
             fallback_limit = max(10, int(strikes) * 4)
-            all_calls = [_normalize_option(c, "call") for c in calls]
-            all_puts = [_normalize_option(p, "put") for p in puts]
-            capped_calls = sorted(
-                all_calls,
-                key=lambda x: (
-                    -to_int(x.get("open_interest"), 0),
-                    to_float(x.get("strike"), 0.0),
-                ),
-            )[:fallback_limit]
-            capped_puts = sorted(
-                all_puts,
-                key=lambda x: (
-                    -to_int(x.get("open_interest"), 0),
-                    to_float(x.get("strike"), 0.0),
-                ),
-            )[:fallback_limit]
+            capped_calls = [
+                _normalize_option(c, "call") for c in heapq.nsmallest(fallback_limit, calls, key=_by_open_interest)
+            ]
+            capped_puts = [
+                _normalize_option(p, "put") for p in heapq.nsmallest(fallback_limit, puts, key=_by_open_interest)
+            ]
             return {
                 "symbol": symbol.upper(),
                 "expiration_date": expiration_date,
                 "current_price": 0.0,
                 "warning": "current_price is 0 or unavailable; strike filtering skipped and response capped by open_interest for LLM safety",
                 "fallback_limit_per_side": fallback_limit,
-                "truncated": len(all_calls) > fallback_limit or len(all_puts) > fallback_limit,
+                "truncated": len(calls) > fallback_limit or len(puts) > fallback_limit,
                 "calls": capped_calls,
                 "puts": capped_puts,
                 "sentiment_stats": {
@@ -1057,16 +1054,13 @@ def get_yf_option_chain(symbol: str, expiration_date: str, strikes: int = 5) ->
                 },
                 "result_text": (
                     f"Warning: current_price for {symbol.upper()} is 0. "
-                    f"Returning capped fallback chain ({len(capped_calls)}/{len(all_calls)} calls, "
-                    f"{len(capped_puts)}/{len(all_puts)} puts) sorted by open_interest."
+                    f"Returning capped fallback chain ({len(capped_calls)}/{len(calls)} calls, "
+                    f"{len(capped_puts)}/{len(puts)} puts) sorted by open_interest."
                 ),
             }
 
-        norm_calls = [_normalize_option(c, "call") for c in calls]
-        norm_puts = [_normalize_option(p, "put") for p in puts]
-
-        selected_calls = select_nearby_strikes(norm_calls, current_price, strikes)
-        selected_puts = select_nearby_strikes(norm_puts, current_price, strikes)
+        selected_calls = [_normalize_option(c, "call") for c in select_nearby_strikes(calls, current_price, strikes)]
+        selected_puts = [_normalize_option(p, "put") for p in select_nearby_strikes(puts, current_price, strikes)]
 
         lines = [
             f"Option Chain for {symbol} (Exp: {data.get('expiration_date')})",
@@ -1291,6 +1285,17 @@ def execute_crypto_order(symbol: str, qty: float, side: str, order_type: str = "
             "result_text": f"Error placing crypto order: {str(e)}",
         }
 
+def _format_stock_order_line(order: dict) -> str:
+    """Render one stock order as a single result_text line."""
+    return (
+        f"ID: {order.get('id')} | {order.get('created_at', 'N/A')} | {order.get('symbol', 'N/A')} | "
+        f"{order.get('side')} {order.get('quantity')} | "
+        f"state: {order.get('state', 'unknown')} | avg_price: {order.get('average_price') or 'N/A'} | "
+        f"limit_price: {order.get('price') or 'N/A'} | "
+        f"type: {order.get('type', 'N/A')} | reject_reason: {order.get('reject_reason') or 'None'}"
+    )
+
+
 @mcp.tool()
 def get_stock_order_history(limit: int = 20, days: int = None, symbol: str = None) -> dict:
     """Fetch history of stock orders with optional filtering. Returns JSON with orders array and result_text for LLM.
@@ -1337,23 +1342,11 @@ def get_stock_order_history(limit: int = 20, days: int = None, symbol: str = Non
         if not orders:
             return {"orders": [], "count": 0, "result_text": "No matching orders found."}
 
-        result_lines = []
         selected = orders[:limit]
-        for order in selected:
-            sym = order.get('symbol', 'N/A')
-            state = order.get('state', 'unknown')
-            date = order.get('created_at', 'N/A')
-            avg_price = order.get('average_price') or 'N/A'
-            limit_price = order.get('price') or 'N/A'
-            result_lines.append(
-                f"ID: {order.get('id')} | {date} | {sym} | {order.get('side')} {order.get('quantity')} | "
-                f"state: {state} | avg_price: {avg_price} | limit_price: {limit_price} | "
-                f"type: {order.get('type', 'N/A')} | reject_reason: {order.get('reject_reason') or 'None'}"
-            )
         return {
             "orders": selected,
             "count": len(selected),
-            "result_text": "\n".join(result_lines),
+            "result_text": "\n".join(map(_format_stock_order_line, selected)),
         }
     except Exception as e:
         return {"orders": [], "count": 0, "error": str(e), "result_text": f"Error fetching order history: {str(e)}"}
@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -309,6 +310,339 @@ class TestStressTester(unittest.TestCase):
         self.assertAlmostEqual(r["expected_pnl_pct"], r["linear_pnl_pct"], places=4)
 
 
+class TestQuantIndicators(unittest.TestCase):
+    def setUp(self):
+        from quant import clear_history_cache
+        clear_history_cache()
+
+    def test_relative_strength_percentile(self):
+        import pandas as pd
+        from quant import calculate_relative_strength
+        idx = pd.date_range("2024-01-01", periods=300)
+        bench = pd.Series(100.0, index=idx)
+        stock = pd.Series([100.0 + (i % 50) for i in range(300)], index=idx)
+        pct = calculate_relative_strength(stock, bench, period=252)
+        window = stock.iloc[-252:]
+        expected = (window <= window.iloc[-1]).mean() * 100
+        self.assertAlmostEqual(pct, expected)
+
+    def test_relative_strength_needs_full_window(self):
+        import pandas as pd
+        from quant import calculate_relative_strength
+        idx = pd.date_range("2024-01-01", periods=300)
+        bench = pd.Series([0.0] * 100 + [100.0] * 200, index=idx)
+        stock = pd.Series(100.0, index=idx)
+        self.assertIsNone(calculate_relative_strength(stock, bench, period=252))
+
+    def test_relative_strength_skips_missing_prices(self):
+        import pandas as pd
+        from quant import calculate_relative_strength
+        idx = pd.date_range("2024-01-01", periods=300)
+        bench = pd.Series(100.0, index=idx)
+        stock = pd.Series([None] * 30 + [100.0 + i for i in range(270)], index=idx)
+        self.assertEqual(calculate_relative_strength(stock, bench, period=252), 100.0)
+        stock.iloc[:60] = None
+        self.assertIsNone(calculate_relative_strength(stock, bench, period=252))
+
+    def test_technical_indicators_trailing_averages(self):
+        import numpy as np
+        import pandas as pd
+        import quant
+
+        idx = pd.date_range("2023-01-02", periods=320, freq="B")
+        close = pd.Series(np.linspace(50.0, 150.0, 320), index=idx)
+        hist = pd.DataFrame(
+            {"Close": close, "High": close + 1.0, "Low": close - 1.0, "Volume": 1_000_000.0},
+            index=idx,
+        )
+
+        class _Ticker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+
+            def history(self, **_kwargs):
+                return hist
+
+        with patch.object(quant.yf, "Ticker", _Ticker):
+            res = quant.get_technical_indicators("TEST")
+        self.assertNotIn("error", res)
+        self.assertAlmostEqual(res["sma_50"], round(close.iloc[-50:].mean(), 2))
+        self.assertAlmostEqual(res["sma_200"], round(close.iloc[-200:].mean(), 2))
+        self.assertAlmostEqual(res["return_5d"], round(close.iloc[-1] / close.iloc[-6] - 1, 4))
+        self.assertAlmostEqual(res["atr_14"], 2.0, places=2)
+
+    def test_greeks_put_call_delta_parity(self):
+        import math
+        from quant import calculate_greeks
+        call = calculate_greeks(S=100, K=95, T=0.25, r=0.045, sigma=0.3, q=0.01, option_type="call")
+        put = calculate_greeks(S=100, K=95, T=0.25, r=0.045, sigma=0.3, q=0.01, option_type="put")
+        self.assertAlmostEqual(call["delta"] - put["delta"], math.exp(-0.01 * 0.25), places=3)
+        self.assertEqual(call["gamma"], put["gamma"])
+        self.assertEqual(call["vega"], put["vega"])
+        self.assertEqual(calculate_greeks(S=100, K=95, T=0, r=0.045, sigma=0.3)["delta"], None)
+
+    def test_portfolio_correlation_pairs(self):
+        import numpy as np
+        import pandas as pd
+        import quant
+
+        idx = pd.date_range("2024-01-01", periods=60)
+        base = np.linspace(10.0, 20.0, 60)
+        close = pd.DataFrame(
+            {"AAA": base, "BBB": base * 2.0, "CCC": np.where(np.arange(60) % 2, 5.0, 6.0)},
+            index=idx,
+        )
+        data = pd.concat({"Close": close}, axis=1)
+        with patch.object(quant.yf, "download", return_value=data):
+            res = quant.get_portfolio_correlation(["AAA", "BBB", "CCC"])
+        self.assertEqual(res["high_correlation_pairs"], [{"pair": ["AAA", "BBB"], "correlation": 1.0}])
+        self.assertEqual(res["correlation_matrix"]["AAA"]["BBB"], 1.0)
+        self.assertEqual(res["basis"], "daily_returns")
+
+    def test_portfolio_correlation_short_history_is_none(self):
+        import numpy as np
+        import pandas as pd
+        import quant
+
+        idx = pd.date_range("2024-01-01", periods=60)
+        base = np.linspace(10.0, 20.0, 60) + np.where(np.arange(60) % 2, 0.3, -0.3)
+        close = pd.DataFrame({"AAA": base, "BBB": base * 2.0, "NEW": [np.nan] * 50 + list(base[-10:])}, index=idx)
+        data = pd.concat({"Close": close}, axis=1)
+        with patch.object(quant.yf, "download", return_value=data):
+            res = quant.get_portfolio_correlation(["AAA", "BBB", "NEW"])
+        self.assertIsNone(res["correlation_matrix"]["NEW"]["AAA"])
+        self.assertEqual(res["correlation_matrix"]["NEW"]["NEW"], None)
+        json.dumps(res, allow_nan=False)
+
+    def test_portfolio_correlation_ignores_shared_trend(self):
+        import numpy as np
+        import pandas as pd
+        import quant
+
+        idx = pd.date_range("2024-01-01", periods=60)
+        trend = np.linspace(10.0, 20.0, 60)
+        close = pd.DataFrame(
+            {"AAA": trend + np.where(np.arange(60) % 2, 0.3, -0.3), "BBB": trend + np.where(np.arange(60) % 3, 0.3, -0.3)},
+            index=idx,
+        )
+        self.assertGreater(close["AAA"].corr(close["BBB"]), 0.7)
+        data = pd.concat({"Close": close}, axis=1)
+        with patch.object(quant.yf, "download", return_value=data):
+            res = quant.get_portfolio_correlation(["AAA", "BBB"])
+        self.assertEqual(res["high_correlation_pairs"], [])
+
+    def test_sector_performance_sorted(self):
+        import pandas as pd
+        import quant
+
+        idx = pd.date_range("2024-01-01", periods=5)
+        close = pd.DataFrame({"XLK": [100.0, 101, 102, 103, 110.0], "XLE": [50.0, 49, 48, 47, 45.0]}, index=idx)
+        data = pd.concat({"Close": close}, axis=1)
+        with patch.object(quant.yf, "download", return_value=data):
+            res = quant.get_sector_performance()
+        self.assertEqual([r["symbol"] for r in res], ["XLK", "XLE"])
+        self.assertAlmostEqual(res[0]["return_5d"], 0.1)
+
+    def test_peers_reuse_sector_profile(self):
+        import quant
+
+        info_reads = []
+
+        class _Ticker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+
+            @property
+            def info(self):
+                info_reads.append(self.symbol)
+                return {"sector": "Energy", "industry": "Oil & Gas", "currentPrice": 1.0}
+
+        with patch.object(quant.yf, "Ticker", _Ticker), patch.object(quant.yf, "Search", side_effect=RuntimeError("offline")):
+            first = quant.get_peers("xom", limit=3)
+            second = quant.get_peers("XOM", limit=3)
+        self.assertEqual(info_reads, ["XOM"])
+        self.assertEqual(first, second)
+        self.assertEqual([p["symbol"] for p in first["peers"]], ["CVX", "COP", "SLB"])
+
+    def test_daily_history_is_reused_across_symbols(self):
+        import pandas as pd
+        import quant
+
+        idx = pd.date_range("2024-01-01", periods=5)
+        hist = pd.DataFrame({"Close": [1.0, 2.0, 3.0, 4.0, 5.0]}, index=idx)
+        fetched = []
+
+        class _Ticker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+
+            def history(self, **kwargs):
+                fetched.append((self.symbol, kwargs.get("period")))
+                return hist
+
+        with patch.object(quant.yf, "Ticker", _Ticker):
+            quant._daily_history("SPY", "2y")
+            quant._daily_history("spy", "2y")
+            quant._daily_history("SPY", "1y")
+        self.assertEqual(fetched, [("SPY", "2y"), ("SPY", "1y")])
+
+
+class TestRedditData(unittest.TestCase):
+    @staticmethod
+    def _comment(cid, replies=None):
+        data = {"id": cid, "body": cid, "score": 1, "created_utc": 0}
+        if replies is not None:
+            data["replies"] = {"data": {"children": replies}}
+        return {"kind": "t1", "data": data}
+
+    def test_flatten_comment_children_depth_first(self):
+        from reddit_data import _flatten_comment_children
+        tree = [
+            self._comment("a", [self._comment("a1", [self._comment("a1x")]), self._comment("a2")]),
+            {"kind": "more", "data": {}},
+            self._comment("b"),
+        ]
+        ids = [c["id"] for c in _flatten_comment_children(tree)]
+        self.assertEqual(ids, ["a", "a1", "a1x", "a2", "b"])
+
+    def test_flatten_comment_children_deep_thread(self):
+        from reddit_data import _flatten_comment_children
+        node = self._comment("leaf")
+        for i in range(3000):
+            node = self._comment(str(i), [node])
+        self.assertEqual(len(_flatten_comment_children([node])), 3001)
+
+
+class TestRedditSentiment(unittest.TestCase):
+    def setUp(self):
+        from reddit_sentiment import clear_sentiment_cache
+        clear_sentiment_cache()
+        self.addCleanup(clear_sentiment_cache)
+
+    @staticmethod
+    def _post(pid, title, author="u1", hours_ago=1.0):
+        return {
+            "id": pid,
+            "title": title,
+            "selftext": "",
+            "author": author,
+            "subreddit": "stocks",
+            "score": 10,
+            "num_comments": 2,
+            "created_utc": time.time() - hours_ago * 3600,
+        }
+
+    def test_known_symbol_mentions_respect_boundaries(self):
+        from reddit_sentiment import _extract_known_symbol_mentions
+        text = "Loading $aapl and TSLA2 calls; AAP flat, no AAPLX"
+        self.assertEqual(_extract_known_symbol_mentions(text, ["AAP", "AAPL", "TSLA"]), ["AAP", "AAPL"])
+        self.assertEqual(_extract_known_symbol_mentions("", ["AAPL"]), [])
+
+    def test_snapshot_aggregates_posts_and_comments(self):
+        import reddit_sentiment
+        posts = {
+            "posts": [
+                self._post("p1", "NVDA and AMD breakout, strong buy", author="u1"),
+                self._post("p2", "Nothing to see here", author="u2"),
+            ],
+            "meta": {"subreddits": ["stocks"]},
+        }
+        comments = {"comments": [
+            {"body": "AMD looks weak", "author": "u3", "score": 4},
+            {"body": "no tickers", "author": "u4", "score": 1},
+        ]}
+        with patch.object(reddit_sentiment, "fetch_reddit_posts", return_value=posts), \
+                patch.object(reddit_sentiment, "fetch_reddit_post_comments", return_value=comments) as fetch_comments:
+            result = reddit_sentiment.get_reddit_sentiment_snapshot("NVDA,AMD")
+        self.assertEqual(fetch_comments.call_count, 1)
+        self.assertEqual(result["data_quality"]["posts_scanned"], 2)
+        self.assertEqual(result["data_quality"]["comments_scanned"], 2)
+        by_symbol = {row["symbol"]: row for row in result["symbols"]}
+        self.assertGreater(by_symbol["NVDA"]["sentiment_score"], 0)
+        self.assertLess(by_symbol["AMD"]["sentiment_score"], by_symbol["NVDA"]["sentiment_score"])
+        self.assertEqual(by_symbol["AMD"]["bearish_ratio"], 0.5)
+
+    def test_comment_fetches_keep_post_order(self):
+        import reddit_sentiment
+        posts = {
+            "posts": [self._post("p1", "NVDA one"), self._post("p2", "NVDA two")],
+            "meta": {"subreddits": ["stocks"]},
+        }
+
+        def fetch_comments(post_id, sort, limit, session=None):
+            if post_id == "p1":
+                time.sleep(0.05)
+            return {"comments": [{"body": f"NVDA reply {post_id}", "author": post_id, "score": 1}]}
+
+        with patch.object(reddit_sentiment, "fetch_reddit_posts", return_value=posts), \
+                patch.object(reddit_sentiment, "fetch_reddit_post_comments", side_effect=fetch_comments):
+            stats, quality = reddit_sentiment._collect_symbol_stats(["NVDA"], "stocks", 24, True, 10)
+        self.assertEqual(quality["comments_scanned"], 2)
+        self.assertEqual(stats["NVDA"]["sample_context"], ["NVDA one", "NVDA reply p1", "NVDA two"])
+
+    def test_trending_reuses_recent_search(self):
+        import reddit_sentiment
+        payload = {"posts": [self._post("p1", "$NVDA breakout")], "meta": {"subreddits": ["stocks"]}}
+        with patch.object(reddit_sentiment, "fetch_reddit_posts", return_value=payload) as fetch, \
+                patch.object(reddit_sentiment, "_prefetch_tradable_symbols"), \
+                patch.object(reddit_sentiment, "_is_likely_tradable_symbol", return_value=True):
+            first = reddit_sentiment.get_reddit_trending_tickers(min_mentions=1)
+            second = reddit_sentiment.get_reddit_trending_tickers(min_mentions=1)
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(first["trending"], second["trending"])
+        self.assertEqual(first["trending"][0]["symbol"], "NVDA")
+
+    def test_trending_validates_candidates_in_one_download(self):
+        import pandas as pd
+        import yfinance as yf
+        import reddit_sentiment
+        payload = {
+            "posts": [self._post("p1", "$NVDA and $ZZZZ to the moon"), self._post("p2", "$NVDA again")],
+            "meta": {"subreddits": ["stocks"]},
+        }
+        columns = pd.MultiIndex.from_product([["Close", "Open"], ["NVDA", "ZZZZ"]])
+        prices = pd.DataFrame([[120.0, float("nan"), 119.0, float("nan")]], columns=columns)
+        with patch.object(reddit_sentiment, "fetch_reddit_posts", return_value=payload), \
+                patch.object(yf, "download", return_value=prices) as download, \
+                patch.object(yf, "Ticker") as ticker:
+            result = reddit_sentiment.get_reddit_trending_tickers(min_mentions=1)
+        self.assertEqual(download.call_count, 1)
+        self.assertEqual(sorted(download.call_args.args[0]), ["NVDA", "ZZZZ"])
+        ticker.assert_not_called()
+        self.assertEqual([row["symbol"] for row in result["trending"]], ["NVDA"])
+
+
+class TestMarketSentiment(unittest.TestCase):
+    def setUp(self):
+        from sentiment import clear_sentiment_cache
+        clear_sentiment_cache()
+        self.addCleanup(clear_sentiment_cache)
+
+    def test_fear_and_greed_is_cached_but_errors_are_not(self):
+        import sentiment
+        ok = {"score": 55.0, "rating": "greed", "previous_close": 50.0, "timestamp": "t"}
+        with patch.object(sentiment, "_fetch_fear_and_greed", side_effect=[{"error": "503"}, ok]) as fetch:
+            self.assertIn("error", sentiment.get_fear_and_greed())
+            first = sentiment.get_fear_and_greed()
+            first["score"] = 0.0
+            second = sentiment.get_fear_and_greed()
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(second["score"], 55.0)
+
+    def test_vix_reads_fast_info(self):
+        from types import SimpleNamespace
+        import sentiment
+        fast_info = SimpleNamespace(
+            last_price=22.0, previous_close=20.0, day_high=23.0, day_low=19.5, year_high=60.0, year_low=float("nan")
+        )
+        with patch.object(sentiment.yf, "Ticker", return_value=SimpleNamespace(fast_info=fast_info)):
+            vix = sentiment.get_vix()
+        self.assertEqual(vix["change"], 2.0)
+        self.assertAlmostEqual(vix["percent_change"], 10.0)
+        self.assertEqual(vix["52_week_high"], 60.0)
+        self.assertIsNone(vix["52_week_low"])
+
+
 class TestQuantAdvanced(unittest.TestCase):
     def test_kelly_sizing_basic(self):
         from quant_advanced import kelly_sizing
@@ -351,6 +685,38 @@ class TestNewsSentiment(unittest.TestCase):
         self.assertEqual(len(r["sources"]), 2)
 
 
+class TestQuantMcpTools(unittest.TestCase):
+    def _tools(self):
+        from mcp_quant_tools import register_quant_tools
+        tools = {}
+
+        class _Recorder:
+            def tool(self):
+                def register(fn):
+                    tools[fn.__name__] = fn
+                    return fn
+                return register
+
+        register_quant_tools(_Recorder())
+        return tools
+
+    def test_multi_stock_quotes_keep_input_order(self):
+        from types import SimpleNamespace
+        import yfinance as yf
+
+        def ticker(sym):
+            if sym == "BAD":
+                raise RuntimeError("no data")
+            time.sleep(0.05 if sym == "AAPL" else 0)
+            return SimpleNamespace(info={"regularMarketPrice": 110.0, "previousClose": 100.0, "sector": sym})
+
+        with patch.object(yf, "Ticker", side_effect=ticker):
+            result = self._tools()["get_multi_stock_quotes"]("aapl, BAD, msft")
+        self.assertEqual([q["symbol"] for q in result["quotes"]], ["AAPL", "MSFT"])
+        self.assertEqual(result["quotes"][0]["change_pct"], 10.0)
+        self.assertEqual(result["errors"], [{"symbol": "BAD", "error": "no data"}])
+
+
 class TestAdvancedMcpSafety(unittest.TestCase):
     def test_workflow_path_rejects_absolute_paths(self):
         from mcp_advanced_tools import _workflow_path
@@ -9,6 +9,10 @@ import auth
 
 
 class TestAuthSessionHandling(unittest.TestCase):
+    def setUp(self):
+        auth._forget_active_session()
+        self.addCleanup(auth._forget_active_session)
+
     def test_null_cache_is_discarded_and_login_is_cached(self):
         with tempfile.TemporaryDirectory() as tmp:
             cache_path = Path(tmp) / "session.json"
@@ -68,6 +72,49 @@ class TestAuthSessionHandling(unittest.TestCase):
         self.assertEqual(payload["refresh_token"], "refresh-123")
         mock_update_session.assert_called_once_with("Authorization", "Bearer new-token")
 
+    def test_active_session_is_reused_without_rereading_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "session.json"
+            cache_path.write_text(json.dumps({
+                "access_token": "token-123",
+                "refresh_token": "refresh-123",
+                "token_type": "Bearer",
+                "created_at": 1000.0,
+                "expires_in": 86400,
+                "expires_at": 87400.0,
+            }))
+
+            with (
+                patch.object(auth, "SESSION_CACHE", cache_path),
+                patch.object(auth, "_now", return_value=1500.0) as mock_now,
+                patch.object(auth.helper, "LOGGED_IN", True),
+                patch.object(auth.rh_auth, "request_post", return_value={
+                    "access_token": "new-token",
+                    "token_type": "Bearer",
+                    "expires_in": 86400,
+                }) as mock_refresh,
+                patch.object(auth.rh, "update_session") as mock_update_session,
+            ):
+                first = auth.get_session()
+                cache_path.write_text("null")
+                second = auth.get_session()
+                self.assertIs(second, first)
+                mock_update_session.assert_called_once_with("Authorization", "Bearer token-123")
+
+                cache_path.write_text(json.dumps(first))
+                mock_now.return_value = 87000.0
+                refreshed = auth.get_session()
+
+        self.assertEqual(refreshed["access_token"], "new-token")
+        mock_refresh.assert_called_once()
+
+    def test_logout_forgets_active_session(self):
+        with patch.object(auth, "SESSION_CACHE", Path("/nonexistent/session.json")):
+            auth._remember_active_session({"access_token": "token-123"})
+            with patch.object(auth.rh, "logout"):
+                auth.logout()
+            self.assertIsNone(auth._active_session())
+
     def test_mcp_mode_requires_manual_login_when_refresh_fails(self):
         with tempfile.TemporaryDirectory() as tmp:
             cache_path = Path(tmp) / "session.json"
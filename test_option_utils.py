@@ -1,5 +1,8 @@
 import unittest
+from unittest.mock import patch
 
+import quote_cache
+import robin_options
 from option_utils import select_nearby_strikes, to_float, to_int
 
 
@@ -25,5 +28,38 @@ class TestOptionUtils(unittest.TestCase):
         self.assertEqual([item["strike"] for item in selected], ["95", "100"])
 
 
+class TestRobinOptions(unittest.TestCase):
+    def setUp(self):
+        robin_options.clear_options_cache()
+        quote_cache.clear_quote_cache()
+        self.addCleanup(robin_options.clear_options_cache)
+        self.addCleanup(quote_cache.clear_quote_cache)
+
+    @staticmethod
+    def _option(strike, opt_type="call", iv="0.5"):
+        return {"state": "active", "type": opt_type, "strike_price": strike, "implied_volatility": iv}
+
+    def test_iv_and_chain_share_one_fetch(self):
+        options = [self._option("95", iv="0.4"), self._option("100", iv="0.3"), self._option("100", "put")]
+        with patch.object(robin_options.rh, "get_chains", return_value={"expiration_dates": ["2026-01-16"]}, create=True) as chains, \
+                patch.object(robin_options.rh, "find_options_by_expiration", return_value=options, create=True) as find, \
+                patch.object(quote_cache.rh, "get_quotes", return_value=[{"symbol": "AAPL", "last_trade_price": "99"}], create=True) as quotes:
+            iv = robin_options.get_implied_volatility("aapl")
+            chain = robin_options.get_option_chain("AAPL", "2026-01-16")
+
+        self.assertEqual(iv, 0.3)
+        self.assertEqual([c["strike"] for c in chain["calls"]], [95.0, 100.0])
+        self.assertEqual(chain["current_price"], 99.0)
+        self.assertEqual(chains.call_count, 1)
+        self.assertEqual(find.call_count, 1)
+        self.assertEqual(quotes.call_count, 1)
+
+    def test_empty_chains_are_not_cached(self):
+        with patch.object(robin_options.rh, "get_chains", return_value=None, create=True) as chains:
+            self.assertEqual(robin_options.get_option_expirations("AAPL"), [])
+            self.assertEqual(robin_options.get_option_expirations("AAPL"), [])
+        self.assertEqual(chains.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,7 @@
+import tempfile
+import threading
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 import sys
 import types
@@ -24,6 +27,7 @@ if "account" not in sys.modules:
 if "portfolio" not in sys.modules:
     portfolio_mod = types.ModuleType("portfolio")
     portfolio_mod.list_positions = lambda: []
+    portfolio_mod.list_position_exposures = lambda: []
     sys.modules["portfolio"] = portfolio_mod
 
 if "market_calendar" not in sys.modules:
@@ -36,14 +40,21 @@ if "reddit_sentiment" not in sys.modules:
     reddit_sentiment_mod.get_reddit_sentiment_snapshot = lambda **_kwargs: {"symbols": []}
     sys.modules["reddit_sentiment"] = reddit_sentiment_mod
 
+import pretrade_policy
 from pretrade_policy import evaluate_pretrade_policy
 
 
 class TestPretradePolicy(unittest.TestCase):
+    def setUp(self):
+        pretrade_policy.clear_sentiment_cache()
+
+    def tearDown(self):
+        pretrade_policy.clear_sentiment_cache()
+
     @patch.dict("os.environ", {"ROBIN_ENABLE_SENTIMENT_GUARDRAIL": "0"}, clear=False)
     @patch("pretrade_policy.get_market_status", return_value={"session": "regular"})
     @patch("pretrade_policy.rh.get_all_open_stock_orders", return_value=[])
-    @patch("pretrade_policy.list_positions", return_value=[])
+    @patch("pretrade_policy.list_position_exposures", return_value=[])
     @patch("pretrade_policy.get_account_profile", return_value={})
     @patch("pretrade_policy._first_quote_price", return_value=10.0)
     def test_buy_blocks_when_account_data_unavailable(
@@ -71,7 +82,7 @@ class TestPretradePolicy(unittest.TestCase):
         "pretrade_policy.rh.get_all_open_stock_orders",
         return_value=[{"symbol": "AAPL", "side": "buy", "quantity": "4", "price": "20"}],
     )
-    @patch("pretrade_policy.list_positions", return_value=[])
+    @patch("pretrade_policy.list_position_exposures", return_value=[])
     @patch(
         "pretrade_policy.get_account_profile",
         return_value={
@@ -107,7 +118,7 @@ class TestPretradePolicy(unittest.TestCase):
     @patch.dict("os.environ", {"ROBIN_ENABLE_SENTIMENT_GUARDRAIL": "0"}, clear=False)
     @patch("pretrade_policy.get_market_status", return_value={"session": "regular"})
     @patch("pretrade_policy.rh.get_all_open_stock_orders", return_value=[])
-    @patch("pretrade_policy.list_positions", return_value=[])
+    @patch("pretrade_policy.list_position_exposures", return_value=[])
     @patch(
         "pretrade_policy.get_account_profile",
         return_value={
@@ -156,7 +167,7 @@ class TestPretradePolicy(unittest.TestCase):
     @patch.dict("os.environ", {"ROBIN_ENABLE_SENTIMENT_GUARDRAIL": "0"}, clear=False)
     @patch("pretrade_policy.get_market_status", return_value={"session": "regular"})
     @patch("pretrade_policy.rh.get_all_open_stock_orders", return_value=[])
-    @patch("pretrade_policy.list_positions", return_value=[{"symbol": "AAPL", "intraday_profit_loss": -5.0, "equity": 200.0}])
+    @patch("pretrade_policy.list_position_exposures", return_value=[{"symbol": "AAPL", "intraday_profit_loss": -5.0, "equity": 200.0}])
     @patch(
         "pretrade_policy.get_account_profile",
         return_value={
@@ -193,6 +204,40 @@ class TestPretradePolicy(unittest.TestCase):
         self.assertEqual(metrics.get("daily_pnl_source"), "equity_vs_previous_close")
         self.assertAlmostEqual(float(metrics.get("daily_pnl_total")), -100.0, places=4)
 
+    @patch.dict("os.environ", {"ROBIN_ENABLE_SENTIMENT_GUARDRAIL": "0"}, clear=False)
+    @patch("pretrade_policy.get_market_status", return_value={"session": "regular"})
+    @patch("pretrade_policy.rh.get_all_open_stock_orders", return_value=[])
+    @patch(
+        "pretrade_policy.list_position_exposures",
+        return_value=[
+            {"symbol": "MSFT", "intraday_profit_loss": 0.0, "equity": 100.0},
+            {"symbol": "", "intraday_profit_loss": 0.0, "equity": 400.0},
+        ],
+    )
+    @patch(
+        "pretrade_policy.get_account_profile",
+        return_value={"equity": 1000.0, "buying_power": 2000.0, "market_value": 500.0},
+    )
+    @patch("pretrade_policy._first_quote_price", return_value=10.0)
+    def test_unresolved_position_counts_toward_symbol_exposure(
+        self,
+        _mock_quote,
+        _mock_account,
+        _mock_positions,
+        _mock_orders,
+        _mock_market,
+    ):
+        result = evaluate_pretrade_policy(
+            symbol="AAPL",
+            qty=1,
+            side="buy",
+            order_type="market",
+            price=None,
+            extended_hours=False,
+        )
+        self.assertAlmostEqual(float(result["metrics"]["symbol_equity_before"]), 400.0, places=4)
+        self.assertEqual(result.get("blocked_by"), "symbol_exposure_limit")
+
     @patch.dict(
         "os.environ",
         {
@@ -204,7 +249,7 @@ class TestPretradePolicy(unittest.TestCase):
     @patch("pretrade_policy.get_reddit_sentiment_snapshot", side_effect=RuntimeError("reddit unavailable"))
     @patch("pretrade_policy.get_market_status", return_value={"session": "regular"})
     @patch("pretrade_policy.rh.get_all_open_stock_orders", return_value=[])
-    @patch("pretrade_policy.list_positions", return_value=[])
+    @patch("pretrade_policy.list_position_exposures", return_value=[])
     @patch(
         "pretrade_policy.get_account_profile",
         return_value={
@@ -250,7 +295,7 @@ class TestPretradePolicy(unittest.TestCase):
     @patch("pretrade_policy.get_reddit_sentiment_snapshot", side_effect=RuntimeError("reddit unavailable"))
     @patch("pretrade_policy.get_market_status", return_value={"session": "regular"})
     @patch("pretrade_policy.rh.get_all_open_stock_orders", return_value=[])
-    @patch("pretrade_policy.list_positions", return_value=[])
+    @patch("pretrade_policy.list_position_exposures", return_value=[])
     @patch(
         "pretrade_policy.get_account_profile",
         return_value={
@@ -284,6 +329,204 @@ class TestPretradePolicy(unittest.TestCase):
         self.assertEqual(sentiment_check.get("status"), "pass")
         self.assertIn("fail_closed=0", sentiment_check.get("detail", ""))
 
+    @patch.dict("os.environ", {"ROBIN_ENABLE_SENTIMENT_GUARDRAIL": "1"}, clear=False)
+    @patch("pretrade_policy.get_reddit_sentiment_snapshot", return_value={"symbols": []})
+    @patch("pretrade_policy.get_market_status", return_value={"session": "regular"})
+    @patch("pretrade_policy.rh.get_all_open_stock_orders", return_value=[])
+    @patch("pretrade_policy.list_position_exposures", return_value=[])
+    @patch(
+        "pretrade_policy.get_account_profile",
+        return_value={
+            "equity": 1000.0,
+            "equity_previous_close": 1000.0,
+            "buying_power": 5.0,
+            "market_value": 0.0,
+        },
+    )
+    @patch("pretrade_policy._first_quote_price", return_value=10.0)
+    def test_fail_fast_skips_sentiment_after_first_blocker(
+        self,
+        _mock_quote,
+        _mock_account,
+        _mock_positions,
+        _mock_orders,
+        _mock_market,
+        mock_sentiment,
+    ):
+        result = evaluate_pretrade_policy(
+            symbol="AAPL",
+            qty=1,
+            side="buy",
+            order_type="market",
+            price=None,
+            extended_hours=False,
+        )
+        self.assertEqual(result.get("blocked_by"), "buying_power")
+        self.assertEqual(result["checks"][-1]["name"], "buying_power")
+        mock_sentiment.assert_not_called()
+
+        audit = evaluate_pretrade_policy(
+            symbol="AAPL",
+            qty=1,
+            side="buy",
+            order_type="market",
+            price=None,
+            extended_hours=False,
+            fail_fast=False,
+        )
+        self.assertEqual(audit.get("blocked_by"), "buying_power")
+        self.assertEqual(audit["checks"][-1]["name"], "sentiment_guardrail")
+        mock_sentiment.assert_called_once()
+
+    @patch("pretrade_policy._SENTIMENT_EXECUTOR")
+    @patch("pretrade_policy.get_reddit_sentiment_snapshot", return_value={"symbols": [{"symbol": "AAPL"}]})
+    def test_sentiment_snapshot_is_served_from_cache(self, mock_sentiment, mock_executor):
+        first = pretrade_policy._cached_sentiment_snapshot("AAPL")
+        second = pretrade_policy._cached_sentiment_snapshot("AAPL")
+        self.assertEqual(first, second)
+        mock_sentiment.assert_called_once()
+        mock_executor.submit.assert_not_called()
+
+        fetched_at, snapshot = pretrade_policy._SENTIMENT_CACHE["AAPL"]
+        pretrade_policy._SENTIMENT_CACHE["AAPL"] = (fetched_at - pretrade_policy._SENTIMENT_REFRESH_SECONDS, snapshot)
+        self.assertEqual(pretrade_policy._cached_sentiment_snapshot("AAPL"), snapshot)
+        self.assertEqual(pretrade_policy._cached_sentiment_snapshot("AAPL"), snapshot)
+        mock_sentiment.assert_called_once()
+        mock_executor.submit.assert_called_once_with(pretrade_policy._refresh_sentiment, "AAPL")
+        pretrade_policy._SENTIMENT_REFRESHING.discard("AAPL")
+
+    @patch("pretrade_policy._SENTIMENT_EXECUTOR")
+    @patch("pretrade_policy.get_reddit_sentiment_snapshot")
+    def test_failed_sentiment_snapshot_is_refetched(self, mock_sentiment, mock_executor):
+        good = {"symbols": [{"symbol": "AAPL"}]}
+        mock_sentiment.side_effect = [{"error": "reddit unavailable"}, {"symbols": []}, good, good]
+        self.assertIn("error", pretrade_policy._cached_sentiment_snapshot("AAPL"))
+        self.assertEqual(pretrade_policy._cached_sentiment_snapshot("AAPL"), {"symbols": []})
+        self.assertEqual(pretrade_policy._cached_sentiment_snapshot("AAPL"), good)
+        self.assertEqual(pretrade_policy._cached_sentiment_snapshot("AAPL"), good)
+        self.assertEqual(mock_sentiment.call_count, 3)
+
+        fetched_at, _ = pretrade_policy._SENTIMENT_CACHE["AAPL"]
+        mock_sentiment.side_effect = None
+        mock_sentiment.return_value = {"error": "reddit unavailable"}
+        pretrade_policy._refresh_sentiment("AAPL")
+        self.assertEqual(pretrade_policy._SENTIMENT_CACHE["AAPL"], (fetched_at, good))
+        mock_executor.submit.assert_not_called()
+
+    @patch.dict(
+        "os.environ",
+        {"ROBIN_ENABLE_HARD_EXCLUDE": "1", "ROBIN_HARD_EXCLUDE_SYMBOLS": "NVDA"},
+        clear=False,
+    )
+    @patch("pretrade_policy.get_account_profile")
+    def test_fail_fast_hard_exclude_skips_network_fetches(self, mock_account):
+        result = evaluate_pretrade_policy(
+            symbol="NVDA",
+            qty=1,
+            side="buy",
+            order_type="limit",
+            price=10.0,
+            extended_hours=False,
+        )
+        self.assertEqual(result.get("blocked_by"), "hard_exclude_list")
+        self.assertEqual([c["name"] for c in result["checks"]], ["hard_exclude_list"])
+        mock_account.assert_not_called()
+
+    @patch.dict("os.environ", {"ROBIN_ENABLE_SENTIMENT_GUARDRAIL": "0"}, clear=False)
+    @patch("pretrade_policy._batch_quote_prices", return_value={"AAPL": 10.0, "TSLA": 20.0})
+    @patch("pretrade_policy.get_market_status", return_value={"session": "regular"})
+    @patch(
+        "pretrade_policy.rh.get_all_open_stock_orders",
+        return_value=[
+            {"symbol": "TSLA", "side": "buy", "quantity": "2", "price": None},
+            {"symbol": "AAPL", "side": "buy", "quantity": "1", "price": ""},
+            {"symbol": "MSFT", "side": "buy", "quantity": "1", "price": "5"},
+        ],
+    )
+    @patch("pretrade_policy.list_position_exposures", return_value=[])
+    @patch(
+        "pretrade_policy.get_account_profile",
+        return_value={
+            "equity": 1000.0,
+            "equity_previous_close": 1000.0,
+            "buying_power": 1000.0,
+            "market_value": 0.0,
+        },
+    )
+    def test_unpriced_open_buys_are_priced_with_one_batch(
+        self,
+        _mock_account,
+        _mock_positions,
+        _mock_orders,
+        _mock_market,
+        mock_prices,
+    ):
+        result = evaluate_pretrade_policy(
+            symbol="AAPL",
+            qty=1,
+            side="buy",
+            order_type="limit",
+            price=10.0,
+            extended_hours=False,
+        )
+        mock_prices.assert_called_once_with(["AAPL", "TSLA"])
+        self.assertAlmostEqual(result["metrics"]["pending_buy_notional_total"], 55.0)
+        self.assertAlmostEqual(result["metrics"]["pending_buy_notional_symbol"], 10.0)
+
+    def test_to_float_falls_back_for_ambiguous_values(self):
+        class Ambiguous:
+            def __eq__(self, other):
+                raise TypeError("ambiguous comparison")
+
+        self.assertEqual(pretrade_policy._to_float(Ambiguous(), 1.5), 1.5)
+        self.assertEqual(pretrade_policy._to_float("", 2.0), 2.0)
+        self.assertEqual(pretrade_policy._to_float(3), 3.0)
+
+    def test_timed_out_prefetch_is_tracked_until_it_finishes(self):
+        release = threading.Event()
+        future = pretrade_policy._prefetch_submit(release.wait)
+        while not future.running():
+            pass
+        self.assertEqual(pretrade_policy._prefetch_result(future, dict, timeout=0.01), {})
+        self.assertIn(future, pretrade_policy._STALLED_PREFETCHES)
+        release.set()
+        future.result(timeout=5)
+        self.assertNotIn(future, pretrade_policy._STALLED_PREFETCHES)
+
+    def test_prefetch_runs_inline_when_pool_is_stalled(self):
+        stalled = {object() for _ in range(pretrade_policy._PREFETCH_WORKERS)}
+        with patch("pretrade_policy._STALLED_PREFETCHES", stalled), patch(
+            "pretrade_policy._PREFETCH_EXECUTOR"
+        ) as executor:
+            future = pretrade_policy._prefetch_submit(lambda: {"equity": 1})
+        executor.submit.assert_not_called()
+        self.assertEqual(pretrade_policy._prefetch_result(future, dict), {"equity": 1})
+
+    def test_instrument_symbols_are_resolved_once_and_persisted(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "instrument_symbols.json"
+            with patch("pretrade_policy._INSTRUMENT_SYMBOL_CACHE_PATH", cache_path), patch(
+                "pretrade_policy._INSTRUMENT_SYMBOL_CACHE", None
+            ), patch("pretrade_policy.rh.get_symbol_by_url", side_effect=lambda url: url.rsplit("/", 1)[-1]) as lookup:
+                urls = {"https://api/instruments/aapl", "https://api/instruments/msft"}
+                first = pretrade_policy._resolve_instrument_symbols(urls)
+                second = pretrade_policy._resolve_instrument_symbols(urls)
+            self.assertEqual(first, {"https://api/instruments/aapl": "AAPL", "https://api/instruments/msft": "MSFT"})
+            self.assertEqual(first, second)
+            self.assertEqual(lookup.call_count, 2)
+            self.assertTrue(cache_path.exists())
+
+    @patch.dict("os.environ", {"ROBIN_MAX_PENDING_ORDERS_PER_SYMBOL": "5"}, clear=False)
+    def test_policy_env_is_parsed_once_until_it_changes(self):
+        pretrade_policy.reload_policy()
+        with patch("pretrade_policy._load_policy_env", wraps=pretrade_policy._load_policy_env) as load:
+            self.assertEqual(pretrade_policy._current_policy().max_pending_orders_per_symbol, 5)
+            self.assertEqual(pretrade_policy._current_policy().max_pending_orders_per_symbol, 5)
+            self.assertEqual(load.call_count, 0)
+            with patch.dict("os.environ", {"ROBIN_MAX_PENDING_ORDERS_PER_SYMBOL": "2"}, clear=False):
+                self.assertEqual(pretrade_policy._current_policy().max_pending_orders_per_symbol, 2)
+            self.assertEqual(load.call_count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+
+import portfolio
+import quote_cache
+
+
+class TestQuoteCache(unittest.TestCase):
+    def setUp(self):
+        quote_cache.clear_quote_cache()
+
+    def test_misses_are_fetched_in_one_batch_and_then_served_from_cache(self):
+        calls = []
+
+        def fake_get_quotes(symbols):
+            calls.append(list(symbols))
+            return [{"symbol": s, "last_trade_price": "1.0"} for s in symbols]
+
+        with patch.object(quote_cache.rh, "get_quotes", side_effect=fake_get_quotes, create=True):
+            first = quote_cache.get_quotes_cached(["aapl", "MSFT", "AAPL"])
+            second = quote_cache.get_quotes_cached("MSFT,TSLA")
+
+        self.assertEqual(["AAPL", "MSFT"], [row["symbol"] for row in first])
+        self.assertEqual(["MSFT", "TSLA"], [row["symbol"] for row in second])
+        self.assertEqual([["AAPL", "MSFT"], ["TSLA"]], calls)
+
+    def test_unknown_symbols_are_not_cached(self):
+        calls = []
+
+        def fake_get_quotes(symbols):
+            calls.append(list(symbols))
+            return [None]
+
+        with patch.object(quote_cache.rh, "get_quotes", side_effect=fake_get_quotes, create=True):
+            self.assertEqual([], quote_cache.get_quotes_cached(["ZZZZ"]))
+            self.assertEqual([], quote_cache.get_quotes_cached(["ZZZZ"]))
+        self.assertEqual(2, len(calls))
+
+
+class TestPositionExposures(unittest.TestCase):
+    def setUp(self):
+        quote_cache.clear_quote_cache()
+        portfolio._INSTRUMENT_SYMBOLS.clear()
+        self.addCleanup(portfolio._INSTRUMENT_SYMBOLS.clear)
+
+    def test_unresolved_instrument_is_kept_and_retried(self):
+        positions = [{"instrument": "https://api/instruments/1/", "quantity": "2", "average_buy_price": "50"}]
+        lookups = [None, RuntimeError("instrument lookup failed"), "aapl"]
+
+        def fake_symbol_by_url(_url):
+            result = lookups.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with (
+            patch.object(portfolio.rh, "get_open_stock_positions", return_value=positions),
+            patch.object(portfolio.rh, "get_symbol_by_url", side_effect=fake_symbol_by_url) as lookup,
+            patch.object(quote_cache.rh, "get_quotes", return_value=[{"symbol": "AAPL", "last_trade_price": "60"}], create=True),
+        ):
+            first = portfolio.list_position_exposures()
+            second = portfolio.list_position_exposures()
+            third = portfolio.list_position_exposures()
+            fourth = portfolio.list_position_exposures()
+
+        for unresolved in (first, second):
+            self.assertEqual([("", 100.0)], [(row["symbol"], row["equity"]) for row in unresolved])
+        self.assertEqual([("AAPL", 120.0)], [(row["symbol"], row["equity"]) for row in third])
+        self.assertEqual(third, fourth)
+        self.assertEqual(3, lookup.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -200,6 +200,67 @@ class TestServerContracts(unittest.TestCase):
         self.assertEqual(result.get("timezone"), "UTC")
         self.assertIn("UTC", result.get("result_text", ""))
 
+    @patch("server.get_yf_options")
+    def test_yf_option_chain_estimates_greeks_only_for_selected_strikes(self, mock_options):
+        def chain(open_interest=0):
+            return [
+                {"strike": float(k), "bid": 1.0, "ask": 1.2, "impliedVolatility": 0.3, "openInterest": open_interest + k}
+                for k in range(80, 121)
+            ]
+
+        mock_options.return_value = {
+            "expiration_date": "2099-01-15",
+            "current_price": 100.5,
+            "calls": chain(),
+            "puts": chain(),
+        }
+        with patch("server.calculate_greeks", wraps=server.calculate_greeks) as greeks:
+            result = server.get_yf_option_chain.fn("AAPL", "2099-01-15", strikes=2)
+        self.assertEqual([c["strike"] for c in result["calls"]], [99.0, 100.0, 101.0, 102.0])
+        self.assertEqual(greeks.call_count, 8)
+        self.assertEqual(result["sentiment_stats"]["total_call_oi"], sum(range(80, 121)))
+
+        mock_options.return_value["current_price"] = 0.0
+        fallback = server.get_yf_option_chain.fn("AAPL", "2099-01-15", strikes=2)
+        self.assertEqual(fallback["calls"][0]["strike"], 120.0)
+        self.assertEqual(len(fallback["calls"]), 10)
+        self.assertTrue(fallback["truncated"])
+
+    @patch("server.get_session")
+    @patch("server.get_history")
+    def test_stock_history_csv_matches_result_text(self, mock_history, _session):
+        mock_history.return_value = [
+            {"begins_at": "2099-01-02T00:00:00Z", "open_price": "1.0", "high_price": "2.0",
+             "low_price": "0.5", "close_price": "1.5", "volume": 10},
+            {"begins_at": "2099-01-03T00:00:00Z", "open_price": "1.5", "high_price": "2.5",
+             "low_price": "1.0", "close_price": "2.0"},
+        ]
+        result = server.get_stock_history.fn("aapl")
+        self.assertEqual(result["csv"].splitlines(), [
+            "Date,Open,High,Low,Close,Volume",
+            "2099-01-02T00:00:00Z,1.0,2.0,0.5,1.5,10",
+            "2099-01-03T00:00:00Z,1.5,2.5,1.0,2.0,0",
+        ])
+        self.assertEqual(result["result_text"], result["csv"])
+
+    @patch("server.get_session")
+    @patch("server.get_order_history")
+    def test_stock_order_history_formats_one_line_per_order(self, mock_orders, _session):
+        mock_orders.return_value = [
+            {"id": f"o{i}", "symbol": "AAPL", "side": "buy", "quantity": "1", "state": "filled",
+             "created_at": "2099-01-02T00:00:00Z", "price": None, "type": "market"}
+            for i in range(3)
+        ]
+        result = server.get_stock_order_history.fn(limit=2)
+        lines = result["result_text"].split("\n")
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            lines[0],
+            "ID: o0 | 2099-01-02T00:00:00Z | AAPL | buy 1 | state: filled | avg_price: N/A | "
+            "limit_price: N/A | type: market | reject_reason: None",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
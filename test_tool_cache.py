@@ -0,0 +1,75 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import tool_cache
+
+
+class TestToolCache(unittest.TestCase):
+    def setUp(self):
+        tool_cache.clear_tool_cache()
+
+    def test_repeated_calls_hit_cache(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"value": len(calls)}
+
+        first = tool_cache.cached_tool_call(("k", "AAPL"), compute)
+        first["result_text"] = "mutated"
+        second = tool_cache.cached_tool_call(("k", "AAPL"), compute)
+        self.assertEqual(1, len(calls))
+        self.assertEqual({"value": 1}, second)
+
+    def test_error_payloads_are_not_cached(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"error": "upstream down"}
+
+        tool_cache.cached_tool_call(("k", "ERR"), compute)
+        tool_cache.cached_tool_call(("k", "ERR"), compute)
+        self.assertEqual(2, len(calls))
+
+    def test_expired_entries_are_recomputed(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"value": len(calls)}
+
+        with patch.object(tool_cache, "_TOOL_CACHE_TTL_SECONDS", 0.01):
+            tool_cache.cached_tool_call(("k", "TTL"), compute)
+            time.sleep(0.02)
+            result = tool_cache.cached_tool_call(("k", "TTL"), compute)
+        self.assertEqual({"value": 2}, result)
+
+    def test_concurrent_identical_calls_compute_once(self):
+        calls = []
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            release.wait(1)
+            return {"value": "shared"}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(tool_cache.cached_tool_call(("k", "SF"), compute)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(1, len(calls))
+        self.assertEqual([{"value": "shared"}] * 4, results)
+
+
+if __name__ == "__main__":
+    unittest.main()
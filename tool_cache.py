@@ -0,0 +1,89 @@
+"""Short-lived result cache for stateless MCP tool handlers.
+
+LLM agent loops often call the same read-only tool with identical arguments
+several times within a single turn. ``cached_tool_call`` memoizes successful
+payloads for a few seconds and single-flights concurrent identical calls so
+only one thread computes while the others wait for its result.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+_TOOL_CACHE_TTL_SECONDS = max(0, int(os.getenv("MCP_TOOL_CACHE_TTL_SECONDS", "30")))
+_TOOL_CACHE_MAXSIZE = 256
+
+_CACHE: Dict[Tuple, Tuple[float, Any]] = {}
+_INFLIGHT: Dict[Tuple, threading.Lock] = {}
+_LOCK = threading.Lock()
+
+
+def _cache_get(key: Tuple):
+    item = _CACHE.get(key)
+    if not item:
+        return None
+    expires_at, value = item
+    if time.monotonic() >= expires_at:
+        _CACHE.pop(key, None)
+        return None
+    return value
+
+
+def _cache_put(key: Tuple, value: Any) -> None:
+    if key not in _CACHE and len(_CACHE) >= _TOOL_CACHE_MAXSIZE:
+        # Dicts preserve insertion order, so the first key is the oldest entry.
+        _CACHE.pop(next(iter(_CACHE)), None)
+    _CACHE[key] = (time.monotonic() + _TOOL_CACHE_TTL_SECONDS, value)
+
+
+def _is_cacheable(value: Any) -> bool:
+    if isinstance(value, dict):
+        return not value.get("error")
+    if isinstance(value, list):
+        return bool(value) and not (isinstance(value[0], dict) and "error" in value[0])
+    return False
+
+
+def _copy(value: Any) -> Any:
+    return dict(value) if isinstance(value, dict) else list(value)
+
+
+def clear_tool_cache() -> None:
+    """Drop all cached tool payloads."""
+    with _LOCK:
+        _CACHE.clear()
+
+
+def cached_tool_call(key: Tuple, compute: Callable[[], Any]) -> Any:
+    """Return ``compute()`` memoized under ``key`` for a short TTL.
+
+    Only dict/list payloads that do not carry an ``error`` are cached, so
+    failures are retried on the next call. Callers receive a shallow copy so
+    top-level mutations (e.g. adding ``result_text``) never leak into the cache.
+    """
+    if _TOOL_CACHE_TTL_SECONDS <= 0:
+        return compute()
+
+    with _LOCK:
+        hit = _cache_get(key)
+        if hit is not None:
+            return _copy(hit)
+        flight = _INFLIGHT.setdefault(key, threading.Lock())
+
+    with flight:
+        with _LOCK:
+            hit = _cache_get(key)
+        if hit is not None:
+            return _copy(hit)
+        try:
+            result = compute()
+            if _is_cacheable(result):
+                with _LOCK:
+                    _cache_put(key, _copy(result))
+        finally:
+            with _LOCK:
+                if _INFLIGHT.get(key) is flight:
+                    _INFLIGHT.pop(key, None)
+    return result